@@ -1,3 +1,3 @@
-from app.api.routes import analysis, audio, health, manga, mangadex, reader
+from app.api.routes import analysis, audio, health, jobs, manga, mangadex, pipeline, reader
 
-__all__ = ["health", "manga", "mangadex", "reader", "analysis", "audio"]
+__all__ = ["health", "manga", "mangadex", "reader", "analysis", "audio", "jobs", "pipeline"]
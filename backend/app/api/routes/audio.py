@@ -1,21 +1,18 @@
-from fastapi import APIRouter, Depends
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from sqlalchemy.orm import Session
-from pydantic import BaseModel
 
 from app.db.database import get_db
-from app.db.schemas import AudioGenerateResponse, AudioStatusResponse
+from app.db.schemas import AudioGenerateRequest, AudioGenerateResponse, AudioStatusResponse
+from app.services.audio_store import audio_store
 from app.services.chapter_service import chapter_service
-from app.services.ocr_service import ocr_service
+from app.services.chapter_text_service import chapter_text_service
 from app.services.tts_service import tts_service
+from app.utils.http_cache import IMMUTABLE_CACHE_CONTROL, etag_matches, quote_etag
 
 router = APIRouter(prefix="/audio", tags=["audio"])
 
 
-class AudioGenerateRequest(BaseModel):
-    text: str | None = None  # Optional: if provided, generates audio for this text instead of entire chapter
-
-
 @router.post("/chapter/{chapter_id}/generate", response_model=AudioGenerateResponse)
 async def generate_chapter_audio(chapter_id: str, request: AudioGenerateRequest | None = None, db: Session = Depends(get_db)) -> AudioGenerateResponse:
     chapter = chapter_service.get_chapter(chapter_id=chapter_id, db=db)
@@ -23,13 +20,14 @@ async def generate_chapter_audio(chapter_id: str, request: AudioGenerateRequest
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail={"message": "Chapter not found"})
 
-    # Use provided text if available, otherwise get entire chapter text
+    # Use provided text if available, otherwise the materialised chapter text and its stored hash
     if request and request.text:
-        chapter_text = request.text
+        result = await tts_service.generate_chapter_audio(chapter_id=chapter_id, chapter_text=request.text)
     else:
-        chapter_text = ocr_service.get_chapter_combined_text(chapter_id=chapter_id, db=db)
-    
-    result = await tts_service.generate_chapter_audio(chapter_id=chapter_id, chapter_text=chapter_text)
+        chapter_text = chapter_text_service.get(chapter_id=chapter_id, db=db)
+        result = await tts_service.generate_chapter_audio(
+            chapter_id=chapter_id, chapter_text=chapter_text.text, text_hash=chapter_text.text_hash
+        )
     return AudioGenerateResponse(**result)
 
 
@@ -40,39 +38,58 @@ def get_chapter_audio_status(chapter_id: str, db: Session = Depends(get_db)) ->
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail={"message": "Chapter not found"})
 
-    chapter_text = ocr_service.get_chapter_combined_text(chapter_id=chapter_id, db=db)
-    result = tts_service.get_chapter_audio_status(chapter_id=chapter_id, chapter_text=chapter_text)
+    chapter_text = chapter_text_service.get(chapter_id=chapter_id, db=db)
+    result = tts_service.get_chapter_audio_status(
+        chapter_id=chapter_id, text_hash=chapter_text.text_hash, text_length=chapter_text.text_length
+    )
     return AudioStatusResponse(**result)
 
 
-@router.get("/file/{chapter_id}/{voice}_{text_hash}.mp3")
-def serve_audio_file(chapter_id: str, voice: str, text_hash: str):
-    from app.core.config import settings
-    from pathlib import Path
+@router.get("/stream/{chapter_id}")
+async def stream_chapter_audio(chapter_id: str, voice: str | None = None, db: Session = Depends(get_db)) -> StreamingResponse:
+    """Chunked chapter audio that starts once the first segment is synthesised."""
+    chapter = chapter_service.get_chapter(chapter_id=chapter_id, db=db)
+    if not chapter:
+        from fastapi import HTTPException
+        raise HTTPException(status_code=404, detail={"message": "Chapter not found"})
 
-    audio_path = Path(settings.audio_cache_dir) / chapter_id / f"{voice}_{text_hash}.mp3"
-    if not audio_path.exists():
+    chapter_text = chapter_text_service.get(chapter_id=chapter_id, db=db)
+    media_type, body = await tts_service.open_chapter_stream(
+        chapter_id=chapter_id, chapter_text=chapter_text.text, text_hash=chapter_text.text_hash, voice=voice
+    )
+    return StreamingResponse(body, media_type=media_type, headers={"Cache-Control": "no-cache"})
+
+
+@router.api_route("/file/{chapter_id}/{voice}_{text_hash}.{extension}", methods=["GET", "HEAD"])
+def serve_audio_file(
+    chapter_id: str,
+    voice: str,
+    text_hash: str,
+    extension: str,
+    if_none_match: str | None = Header(default=None),
+    db: Session = Depends(get_db),
+):
+    # Size, media type and content hash come from the audio index, recorded when the file was written
+    audio_file = audio_store.get(f"{chapter_id}/{voice}_{text_hash}.{extension}", db=db)
+    if audio_file is None:
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail={"message": "Audio file not found"})
 
-    # Determine media type based on actual file content
-    file_size = audio_path.stat().st_size
-    
-    # Check if it's actually a WAV file (starts with RIFF)
-    with open(audio_path, 'rb') as f:
-        header = f.read(4)
-        if header == b'RIFF':
-            media_type = "audio/wav"
-        elif header[:2] == b'\xff\xfb' or header[:2] == b'\xff\xfa':  # MP3 sync
-            media_type = "audio/mpeg"
-        else:
-            media_type = "audio/mpeg"  # Default fallback
-    
-    # Return with proper headers for streaming
+    audio_path = audio_store.path_for_key(audio_file.path)
+    if audio_store.touch_if_stale(audio_file, db=db):
+        db.commit()
+
+    # The URL embeds the text hash, so a given URL always names the same audio
+    headers = {"Accept-Ranges": "bytes", "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+    if audio_file.content_hash:
+        headers["ETag"] = quote_etag(audio_file.content_hash)
+        if etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+
+    # FileResponse answers Range and If-Range requests with 206 partial content
     return FileResponse(
         path=audio_path,
-        media_type=media_type,
-        filename=f"{chapter_id}.mp3",
-        headers={"Accept-Ranges": "bytes"}
+        media_type=audio_file.media_type,
+        filename=f"{chapter_id}.{extension}",
+        headers=headers,
     )
-
@@ -0,0 +1,73 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app.db.database import get_db
+from app.db.schemas import AudioGenerateRequest, JobOut
+from app.services.chapter_service import chapter_service
+from app.services.job_service import JobService, job_service
+from app.services.page_service import page_service
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+def _job_out(job, reused: bool) -> JobOut:
+    return JobOut.model_validate(job).model_copy(update={"reused": reused})
+
+
+@router.post("/ocr/chapter/{chapter_id}", response_model=JobOut, status_code=202)
+def enqueue_chapter_ocr(
+    chapter_id: str,
+    parallel: bool = Query(True),
+    mode: Literal["page", "panels", "regions"] = Query("page"),
+    force: bool = Query(False),
+    db: Session = Depends(get_db),
+) -> JobOut:
+    if not chapter_service.get_chapter(chapter_id=chapter_id, db=db):
+        raise HTTPException(status_code=404, detail={"message": "Chapter not found"})
+
+    job, reused = job_service.submit(JobService.KIND_OCR_CHAPTER, chapter_id, db, payload={"parallel": parallel, "mode": mode, "force": force})
+    return _job_out(job, reused)
+
+
+@router.post("/analysis/page/{page_id}", response_model=JobOut, status_code=202)
+def enqueue_page_analysis(page_id: int, db: Session = Depends(get_db)) -> JobOut:
+    if not page_service.get_page(page_id=page_id, db=db):
+        raise HTTPException(status_code=404, detail={"message": "Page not found"})
+
+    job, reused = job_service.submit(JobService.KIND_ANALYSIS_PAGE, str(page_id), db)
+    return _job_out(job, reused)
+
+
+@router.post("/audio/chapter/{chapter_id}", response_model=JobOut, status_code=202)
+def enqueue_chapter_audio(chapter_id: str, request: AudioGenerateRequest | None = None, db: Session = Depends(get_db)) -> JobOut:
+    if not chapter_service.get_chapter(chapter_id=chapter_id, db=db):
+        raise HTTPException(status_code=404, detail={"message": "Chapter not found"})
+
+    payload = {"text": request.text} if request and request.text else None
+    job, reused = job_service.submit(JobService.KIND_AUDIO_CHAPTER, chapter_id, db, payload=payload)
+    return _job_out(job, reused)
+
+
+@router.post("/prefetch/chapter/{chapter_id}", response_model=JobOut, status_code=202)
+def enqueue_chapter_prefetch(chapter_id: str, db: Session = Depends(get_db)) -> JobOut:
+    if not chapter_service.get_chapter(chapter_id=chapter_id, db=db):
+        raise HTTPException(status_code=404, detail={"message": "Chapter not found"})
+
+    job, reused = job_service.submit(JobService.KIND_PREFETCH_CHAPTER, chapter_id, db)
+    return _job_out(job, reused)
+
+
+@router.post("/pipeline/chapter/{chapter_id}", response_model=JobOut, status_code=202)
+def enqueue_chapter_pipeline(chapter_id: str, db: Session = Depends(get_db)) -> JobOut:
+    if not chapter_service.get_chapter(chapter_id=chapter_id, db=db):
+        raise HTTPException(status_code=404, detail={"message": "Chapter not found"})
+
+    job, reused = job_service.submit(JobService.KIND_PIPELINE_CHAPTER, chapter_id, db)
+    return _job_out(job, reused)
+
+
+@router.get("/{job_id}", response_model=JobOut)
+def get_job(job_id: int, db: Session = Depends(get_db)) -> JobOut:
+    return _job_out(job_service.get_job(job_id=job_id, db=db), reused=False)
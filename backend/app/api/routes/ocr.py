@@ -1,16 +1,37 @@
-from fastapi import APIRouter, Depends
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.db.database import get_db
-from app.db.schemas import OcrChapterResultResponse, OcrChapterRunResponse, OcrPageResult, OcrPageRunResponse
+from app.db.database import SessionLocal, get_db
+from app.db.schemas import (
+    OcrChapterResultResponse,
+    OcrChapterRunResponse,
+    OcrChapterSummaryResponse,
+    OcrPageResult,
+    OcrPageRunResponse,
+)
+from app.services.chapter_service import chapter_service
+from app.services.event_bus import ocr_events
 from app.services.ocr_service import ocr_service
 
 router = APIRouter(prefix="/ocr", tags=["ocr"])
 
+SSE_KEEPALIVE_SECONDS = 15.0
+
 
 @router.post("/page/{page_id}", response_model=OcrPageRunResponse)
-def ocr_page(page_id: int, db: Session = Depends(get_db)) -> OcrPageRunResponse:
-    ocr = ocr_service.run_page_ocr(page_id=page_id, db=db)
+def ocr_page(
+    page_id: int,
+    mode: Literal["page", "panels", "regions"] = Query("page"),
+    db: Session = Depends(get_db),
+) -> OcrPageRunResponse:
+    ocr = ocr_service.run_page_ocr(page_id=page_id, db=db, mode=mode)
     page, _ = ocr_service.get_page_ocr(page_id=page_id, db=db)
     text_length = len((ocr.cleaned_text or "").strip())
     return OcrPageRunResponse(
@@ -24,8 +45,14 @@ def ocr_page(page_id: int, db: Session = Depends(get_db)) -> OcrPageRunResponse:
 
 
 @router.post("/chapter/{chapter_id}", response_model=OcrChapterRunResponse)
-def ocr_chapter(chapter_id: str, db: Session = Depends(get_db)) -> OcrChapterRunResponse:
-    result = ocr_service.run_chapter_ocr(chapter_id=chapter_id, db=db)
+def ocr_chapter(
+    chapter_id: str,
+    parallel: bool = Query(True),
+    mode: Literal["page", "panels", "regions"] = Query("page"),
+    force: bool = Query(False),
+    db: Session = Depends(get_db),
+) -> OcrChapterRunResponse:
+    result = ocr_service.run_chapter_ocr(chapter_id=chapter_id, db=db, parallel=parallel, mode=mode, force=force)
     return OcrChapterRunResponse(**result)
 
 
@@ -38,7 +65,7 @@ def get_page_ocr(page_id: int, db: Session = Depends(get_db)) -> OcrPageResult:
             page_id=page.id,
             page_number=page.page_number,
             status="pending",
-            engine_name="pytesseract",
+            engine_name=ocr_service.engine_name,
             raw_text=None,
             cleaned_text=None,
             text_length=0,
@@ -62,3 +89,54 @@ def get_page_ocr(page_id: int, db: Session = Depends(get_db)) -> OcrPageResult:
 def get_chapter_ocr(chapter_id: str, db: Session = Depends(get_db)) -> OcrChapterResultResponse:
     result = ocr_service.get_chapter_ocr(chapter_id=chapter_id, db=db)
     return OcrChapterResultResponse(**result)
+
+
+@router.get("/chapter/{chapter_id}/summary", response_model=OcrChapterSummaryResponse, response_model_exclude_none=True)
+def get_chapter_ocr_summary(
+    chapter_id: str,
+    include_text: bool = Query(False),
+    db: Session = Depends(get_db),
+) -> OcrChapterSummaryResponse:
+    result = ocr_service.get_chapter_ocr_summary(chapter_id=chapter_id, db=db, include_text=include_text)
+    return OcrChapterSummaryResponse(**result)
+
+
+@router.get("/chapter/{chapter_id}/events")
+def stream_chapter_ocr_events(chapter_id: str, db: Session = Depends(get_db)) -> StreamingResponse:
+    """Server-Sent Events: a status-count snapshot, then page transitions until the run's summary (or error)."""
+    if not chapter_service.get_chapter(chapter_id=chapter_id, db=db):
+        raise HTTPException(status_code=404, detail={"message": "Chapter not found"})
+
+    return StreamingResponse(
+        _chapter_event_stream(chapter_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _chapter_event_stream(chapter_id: str) -> AsyncIterator[str]:
+    # Subscribe before taking the snapshot so no transition falls between the two.
+    with ocr_events.subscribe(chapter_id) as queue:
+        counts = await run_in_threadpool(_chapter_status_counts, chapter_id)
+        yield _format_sse("snapshot", {"chapter_id": chapter_id, **counts})
+        while True:
+            try:
+                message = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield _format_sse(message["event"], message["data"])
+            if message["event"] in ("summary", "error"):
+                return
+
+
+def _chapter_status_counts(chapter_id: str) -> dict[str, int]:
+    db = SessionLocal()
+    try:
+        return ocr_service.get_chapter_status_counts(chapter_id=chapter_id, db=db)
+    finally:
+        db.close()
+
+
+def _format_sse(event: str, data: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
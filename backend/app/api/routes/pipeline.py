@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.db.database import get_db
+from app.db.schemas import PipelineChapterResponse, PipelinePageResult
+from app.services.page_pipeline_service import page_pipeline_service
+
+router = APIRouter(prefix="/pipeline", tags=["pipeline"])
+
+
+@router.post("/page/{page_id}", response_model=PipelinePageResult)
+def process_page(page_id: int, db: Session = Depends(get_db)) -> PipelinePageResult:
+    result = page_pipeline_service.process_page(page_id=page_id, db=db)
+    return PipelinePageResult(**result)
+
+
+@router.post("/chapter/{chapter_id}", response_model=PipelineChapterResponse)
+def process_chapter(chapter_id: str, db: Session = Depends(get_db)) -> PipelineChapterResponse:
+    result = page_pipeline_service.process_chapter(chapter_id=chapter_id, db=db)
+    return PipelineChapterResponse(**result)
@@ -1,10 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import FileResponse, Response
 from sqlalchemy.orm import Session
 
 from app.db.database import get_db
-from app.db.schemas import ChapterOut, PageOut
+from app.db.schemas import (
+    ChapterOut,
+    PageOut,
+    PrefetchResponse,
+    ReaderChapterBundleResponse,
+    ReadingProgressRequest,
+    ReadingProgressResponse,
+)
 from app.services.chapter_service import chapter_service
+from app.services.image_store import image_store
 from app.services.page_service import page_service
+from app.services.prefetch_service import prefetch_service
+from app.services.reader_service import reader_service
+from app.services.reading_progress_service import reading_progress_service
+from app.utils.http_cache import etag_matches, quote_etag
 
 router = APIRouter(tags=["reader"])
 
@@ -41,3 +56,49 @@ def get_chapter_pages(chapter_id: str, db: Session = Depends(get_db)) -> list[Pa
         result.append(PageOut(**page_dict))
     
     return result
+
+
+@router.get("/reader/chapter/{chapter_id}/bundle", response_model=ReaderChapterBundleResponse)
+def get_reader_chapter_bundle(chapter_id: str, db: Session = Depends(get_db)) -> ReaderChapterBundleResponse:
+    """Chapter, pages with OCR text, OCR summary, audio status and adjacent chapter ids in one response."""
+    return ReaderChapterBundleResponse(**reader_service.get_chapter_bundle(chapter_id=chapter_id, db=db))
+
+
+@router.put("/reader/chapter/{chapter_id}/progress", response_model=ReadingProgressResponse)
+def update_reading_progress(
+    chapter_id: str, request: ReadingProgressRequest, db: Session = Depends(get_db)
+) -> ReadingProgressResponse:
+    """Record the current page; near the end of the chapter this starts warming up the next one."""
+    result = reading_progress_service.record(chapter_id=chapter_id, page_number=request.page_number, db=db)
+    return ReadingProgressResponse(**result)
+
+
+@router.post("/chapters/{chapter_id}/prefetch", response_model=PrefetchResponse)
+def prefetch_chapter_images(chapter_id: str, db: Session = Depends(get_db)) -> PrefetchResponse:
+    result = prefetch_service.prefetch_chapter(chapter_id=chapter_id, db=db)
+    return PrefetchResponse(**result)
+
+
+@router.get("/pages/{page_id}/image")
+def get_page_image(
+    page_id: int,
+    w: int | None = Query(default=None, ge=16, le=4096),
+    format: Literal["webp", "jpeg", "png"] | None = None,
+    if_none_match: str | None = Header(default=None),
+    db: Session = Depends(get_db),
+):
+    """Page image from the local cache, optionally resized to ``w`` pixels wide and re-encoded."""
+    page = page_service.get_page(page_id=page_id, db=db)
+    if not page:
+        raise HTTPException(status_code=404, detail={"message": "Page not found"})
+
+    try:
+        image_path, content_hash = image_store.derivative(page=page, width=w, image_format=format, db=db)
+    except ValueError as exc:
+        raise HTTPException(status_code=500, detail={"message": "Failed to prepare page image", "error": str(exc)}) from exc
+
+    # A page can be re-stored at another quality, so clients revalidate with the ETag after a day
+    headers = {"ETag": quote_etag(content_hash), "Cache-Control": "public, max-age=86400"}
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path=image_path, headers=headers)
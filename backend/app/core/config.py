@@ -8,13 +8,35 @@ class Settings(BaseSettings):
     mangadex_base_url: str = "https://api.mangadex.org"
     mangadex_at_home_base_url: str = "https://api.mangadex.org/at-home/server"
     request_timeout_seconds: int = 20
+    http2_enabled: bool = True
+    http_max_connections_per_host: int = 8
+    http_keepalive_expiry_seconds: float = 30.0
+    http_retry_attempts: int = 3
+    http_retry_backoff_seconds: float = 0.5
+    http_retry_after_max_seconds: float = 30.0
+    http_max_hosts: int = 16
     default_language: str = "en"
     page_cache_dir: str = "./storage/pages"
+    page_cache_max_bytes: int = 2 * 1024 * 1024 * 1024
+    prefetch_concurrency: int = 6
+    prefetch_on_store: bool = True
     ocr_engine_name: str = "pytesseract"
     tesseract_cmd: str | None = None
-    tts_engine_name: str = "edge-tts"
+    ocr_max_workers: int = 4
+    ocr_panel_workers: int = 4
+    tts_engine_name: str = "gtts"
+    piper_model_path: str = "~/.local/share/piper_tts/en_US-amy-medium.onnx"
     tts_default_voice: str = "en-US-AriaNeural"
+    tts_max_workers: int = 2
     audio_cache_dir: str = "./storage/audio"
+    audio_cache_max_bytes: int = 1024 * 1024 * 1024
+    audio_cache_scan_interval_seconds: int = 3600
+    job_ocr_workers: int = 1
+    job_analysis_workers: int = 2
+    job_audio_workers: int = 1
+    job_prefetch_workers: int = 1
+    warmup_threshold: float = 0.75
+    warmup_retry_seconds: int = 300
 
     model_config = SettingsConfigDict(
         env_file=".env",
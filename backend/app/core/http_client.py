@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.config import settings
+
+try:
+    import h2  # noqa: F401
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+
+class HttpClientManager:
+    """Application-scoped HTTP clients: one keep-alive pool per host, shared by every service.
+
+    At most ``settings.http_max_hosts`` pools are kept; the least recently used one is dropped to make room,
+    so the rotating MangaDex@Home nodes do not accumulate idle clients. Requests hold a lease on their
+    client, and a dropped client is closed once its last lease is released.
+    """
+
+    USER_AGENT = "automated-manga-reader-mvp/0.1"
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+    def __init__(self) -> None:
+        self._clients: OrderedDict[str, httpx.Client] = OrderedDict()
+        self._leases: dict[httpx.Client, int] = {}
+        self._retired: set[httpx.Client] = set()
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self.lease(settings.mangadex_base_url):
+            pass
+
+    def close(self) -> None:
+        with self._lock:
+            clients = [*self._clients.values(), *self._retired]
+            self._clients.clear()
+            self._retired.clear()
+        for client in clients:
+            client.close()
+
+    @contextmanager
+    def lease(self, url: str) -> Iterator[httpx.Client]:
+        """The shared client for ``url``'s host, kept open until the block exits even if it is evicted meanwhile."""
+        with self._lock:
+            client, evicted = self._client_for(url)
+            self._leases[client] = self._leases.get(client, 0) + 1
+        for stale_client in evicted:
+            stale_client.close()
+        try:
+            yield client
+        finally:
+            with self._lock:
+                remaining = self._leases.pop(client) - 1
+                if remaining:
+                    self._leases[client] = remaining
+                close = not remaining and client in self._retired
+                if close:
+                    self._retired.discard(client)
+            if close:
+                client.close()
+
+    def _client_for(self, url: str) -> tuple[httpx.Client, list[httpx.Client]]:
+        """(client, evicted clients that are safe to close now); the caller holds ``_lock``."""
+        host = self._host_key(url)
+        evicted: list[httpx.Client] = []
+        client = self._clients.get(host)
+        if client is not None:
+            self._clients.move_to_end(host)
+            return client, evicted
+
+        client = httpx.Client(
+            timeout=settings.request_timeout_seconds,
+            headers={"User-Agent": self.USER_AGENT},
+            transport=httpx.HTTPTransport(
+                http2=settings.http2_enabled and H2_AVAILABLE,
+                limits=self._limits(),
+            ),
+        )
+        self._clients[host] = client
+        while len(self._clients) > max(settings.http_max_hosts, 1):
+            stale_client = self._clients.popitem(last=False)[1]
+            if stale_client in self._leases:
+                self._retired.add(stale_client)
+            else:
+                evicted.append(stale_client)
+        return client, evicted
+
+    def async_client(self) -> httpx.AsyncClient:
+        """Async client with the shared pool settings; async pools are bound to one event loop, so callers own it."""
+        return httpx.AsyncClient(
+            timeout=settings.request_timeout_seconds,
+            headers={"User-Agent": self.USER_AGENT},
+            http2=settings.http2_enabled and H2_AVAILABLE,
+            limits=self._limits(),
+        )
+
+    def get(self, url: str, params: dict[str, Any] | None = None, timeout: float | None = None) -> httpx.Response:
+        """GET with retry and exponential backoff on transport errors and retryable status codes."""
+        max_retries = max(settings.http_retry_attempts, 0)
+        attempt = 0
+
+        while True:
+            response: httpx.Response | None = None
+            try:
+                with self.lease(url) as client:
+                    response = client.get(url, params=params, timeout=timeout or httpx.USE_CLIENT_DEFAULT)
+            except httpx.TransportError:
+                if attempt >= max_retries:
+                    raise
+            else:
+                if response.status_code not in self.RETRY_STATUS_CODES or attempt >= max_retries:
+                    return response
+
+            time.sleep(self.backoff_seconds(attempt, response))
+            attempt += 1
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=settings.http_max_connections_per_host,
+            max_keepalive_connections=settings.http_max_connections_per_host,
+            keepalive_expiry=settings.http_keepalive_expiry_seconds,
+        )
+
+    def backoff_seconds(self, attempt: int, response: httpx.Response | None = None) -> float:
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), settings.http_retry_after_max_seconds)
+        return settings.http_retry_backoff_seconds * (2**attempt)
+
+    def _host_key(self, url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+
+http_client = HttpClientManager()
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.database import Base
@@ -103,7 +103,81 @@ class PageOCR(Base):
     cleaned_text: Mapped[str | None] = mapped_column(Text, nullable=True)
     engine_name: Mapped[str] = mapped_column(String(64), nullable=False, default="pytesseract")
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    image_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    config_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
     page: Mapped[Page] = relationship("Page", back_populates="ocr_result")
+
+
+class ChapterText(Base):
+    """Chapter OCR text joined in page order, kept in step with page OCR writes so readers skip the rebuild."""
+
+    __tablename__ = "chapter_text"
+
+    chapter_id: Mapped[str] = mapped_column(ForeignKey("chapter.id", ondelete="CASCADE"), primary_key=True)
+    text: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    text_length: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    text_hash: Mapped[str] = mapped_column(String(32), nullable=False)
+    # [page_number, length] of each page joined into ``text``, in order; lets one page be replaced in place.
+    page_spans: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
+class ImageBlob(Base):
+    __tablename__ = "image_blob"
+
+    digest: Mapped[str] = mapped_column(String(64), primary_key=True)
+    path: Mapped[str] = mapped_column(Text, nullable=False)
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    derivative_bytes: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    last_accessed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class AudioFile(Base):
+    __tablename__ = "audio_file"
+
+    path: Mapped[str] = mapped_column(String(512), primary_key=True)  # Relative to audio_cache_dir
+    chapter_id: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)  # None for shared segments
+    engine: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    voice: Mapped[str] = mapped_column(String(128), nullable=False)
+    text_hash: Mapped[str] = mapped_column(String(32), nullable=False)
+    media_type: Mapped[str] = mapped_column(String(32), nullable=False)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)  # sha256, served as the ETag
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_accessed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class ReadingProgress(Base):
+    __tablename__ = "reading_progress"
+
+    chapter_id: Mapped[str] = mapped_column(ForeignKey("chapter.id", ondelete="CASCADE"), primary_key=True)
+    manga_id: Mapped[int] = mapped_column(ForeignKey("manga.id", ondelete="CASCADE"), nullable=False, index=True)
+    page_number: Mapped[int] = mapped_column(Integer, nullable=False)
+    warmup_job_id: Mapped[int | None] = mapped_column(ForeignKey("job.id", ondelete="SET NULL"), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
+class Job(Base):
+    __tablename__ = "job"
+    __table_args__ = (
+        Index("ix_job_kind_target_status", "kind", "target_id", "status"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    kind: Mapped[str] = mapped_column(String(32), nullable=False)
+    target_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    status: Mapped[str] = mapped_column(String(32), nullable=False, default="queued", index=True)
+    priority: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")  # Lower runs first
+    payload: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    result: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    progress_current: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    progress_total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
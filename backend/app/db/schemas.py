@@ -13,6 +13,8 @@ class DependencyHealthResponse(BaseModel):
     tesseract_available: bool
     tesseract_cmd: str
     error_message: str | None = None
+    engine_name: str | None = None
+    engine_fallback_reason: str | None = None
 
 
 class MangaCreate(BaseModel):
@@ -94,6 +96,16 @@ class StoreChapterResponse(BaseModel):
     total_pages: int
 
 
+class PrefetchResponse(BaseModel):
+    chapter_id: str
+    pages_total: int
+    downloaded_count: int
+    cached_count: int
+    failed_count: int
+    failed_page_ids: list[int] = []
+    elapsed_ms: float
+
+
 class PanelOut(BaseModel):
     id: int
     panel_index: int
@@ -115,6 +127,26 @@ class AnalysisResponse(BaseModel):
     panel_count: int
 
 
+class PipelinePageResult(BaseModel):
+    page_id: int
+    page_number: int
+    analysis_status: str
+    panel_count: int
+    ocr_status: str
+    text_length: int
+    error_message: str | None = None
+    elapsed_ms: float
+
+
+class PipelineChapterResponse(BaseModel):
+    chapter_id: str
+    pages_processed: int
+    success_count: int
+    failure_count: int
+    elapsed_ms: float
+    page_results: list[PipelinePageResult]
+
+
 class AudioResponse(BaseModel):
     chapter_id: str
     status: str
@@ -143,12 +175,24 @@ class OcrPageRunResponse(BaseModel):
     error_message: str | None = None
 
 
+class OcrPageTiming(BaseModel):
+    page_id: int
+    page_number: int
+    status: str
+    elapsed_ms: float
+
+
 class OcrChapterRunResponse(BaseModel):
     chapter_id: str
     pages_processed: int
     success_count: int
     failure_count: int
     completed_count: int
+    skipped_count: int = 0
+    mode: str = "page"
+    workers: int = 1
+    elapsed_ms: float = 0.0
+    page_timings: list[OcrPageTiming] = []
 
 
 class OcrChapterResultResponse(BaseModel):
@@ -164,11 +208,41 @@ class OcrChapterResultResponse(BaseModel):
     page_results: list[OcrPageResult]
 
 
+class OcrPageSummary(BaseModel):
+    page_id: int
+    page_number: int
+    status: str
+    text_length: int = 0
+    error_message: str | None = None
+    cleaned_text: str | None = None
+
+
+class OcrChapterSummaryResponse(BaseModel):
+    chapter_id: str
+    status: str
+    pages_total: int
+    completed_count: int
+    failed_count: int
+    processing_count: int
+    pending_count: int
+    chapter_text_length: int
+    chapter_text: str | None = None
+    page_results: list[OcrPageSummary]
+
+
 class TtsHealthResponse(BaseModel):
     tts_available: bool
     engine_name: str
     default_voice: str
     error_message: str | None = None
+    engine_fallback_reason: str | None = None
+    max_workers: int = 1
+    active_count: int = 0
+    queue_depth: int = 0
+
+
+class AudioGenerateRequest(BaseModel):
+    text: str | None = None  # Optional: if provided, generates audio for this text instead of entire chapter
 
 
 class AudioGenerateResponse(BaseModel):
@@ -178,6 +252,8 @@ class AudioGenerateResponse(BaseModel):
     text_length: int
     audio_url: str
     cached: bool
+    segments_total: int = 1
+    segments_generated: int = 0
     error_message: str | None = None
 
 
@@ -190,3 +266,43 @@ class AudioStatusResponse(BaseModel):
     generated: bool
     cached: bool
     audio_url: str | None = None
+
+
+class ReaderChapterBundleResponse(BaseModel):
+    chapter: ChapterOut
+    pages: list[PageOut]
+    ocr: OcrChapterSummaryResponse
+    audio: AudioStatusResponse
+    prev_chapter_id: str | None = None
+    next_chapter_id: str | None = None
+
+
+class ReadingProgressRequest(BaseModel):
+    page_number: int = Field(ge=1)
+
+
+class ReadingProgressResponse(BaseModel):
+    chapter_id: str
+    page_number: int
+    pages_total: int
+    next_chapter_id: str | None = None
+    warmup_job_id: int | None = None
+    warmup_status: str | None = None
+
+
+class JobOut(BaseModel):
+    id: int
+    kind: str
+    target_id: str
+    status: str
+    priority: int = 0
+    progress_current: int
+    progress_total: int
+    result: dict | None = None
+    error_message: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    reused: bool = False
+
+    model_config = {"from_attributes": True}
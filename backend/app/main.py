@@ -4,12 +4,18 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api.routes.analysis import router as analysis_router
 from app.api.routes.audio import router as audio_router
 from app.api.routes.health import router as health_router
+from app.api.routes.jobs import router as jobs_router
 from app.api.routes.manga import router as manga_router
 from app.api.routes.mangadex import router as mangadex_router
 from app.api.routes.ocr import router as ocr_router
+from app.api.routes.pipeline import router as pipeline_router
 from app.api.routes.reader import router as reader_router
 from app.core.config import settings
-from app.db.database import init_db
+from app.core.http_client import http_client
+from app.db.database import SessionLocal, init_db
+from app.services.audio_store import audio_store
+from app.services.image_store import image_store
+from app.services.job_service import job_service
 from app.services.ocr_service import ocr_service
 from app.services.tts_service import tts_service
 from app.utils.file_storage import ensure_dir
@@ -38,9 +44,27 @@ app.add_middleware(
 @app.on_event("startup")
 def on_startup() -> None:
     init_db()
+    http_client.start()
     ocr_service.refresh_dependency_status()
     tts_service.refresh_dependency_status()
+    tts_service.start()
     ensure_dir(settings.audio_cache_dir)
+    db = SessionLocal()
+    try:
+        image_store.enforce_budget(db=db)
+    finally:
+        db.close()
+    audio_store.start()
+    job_service.start()
+
+
+@app.on_event("shutdown")
+def on_shutdown() -> None:
+    job_service.shutdown()
+    audio_store.shutdown()
+    ocr_service.shutdown()
+    tts_service.shutdown()
+    http_client.close()
 
 
 @app.get("/")
@@ -54,5 +78,7 @@ app.include_router(mangadex_router)
 app.include_router(reader_router)
 app.include_router(analysis_router)
 app.include_router(ocr_router)
+app.include_router(pipeline_router)
 app.include_router(audio_router)
+app.include_router(jobs_router)
 
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import os
+import threading
+from abc import ABC, abstractmethod
+
+import cv2
+import numpy as np
+import pytesseract
+
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+
+class OcrEngine(ABC):
+    """Text recognition backend used by ``OcrService``; takes already preprocessed NumPy images."""
+
+    name = "base"
+
+    @abstractmethod
+    def version(self) -> str:
+        """Engine version string; raises when the engine cannot run on this machine."""
+
+    @abstractmethod
+    def image_to_string(self, image: np.ndarray) -> str:
+        ...
+
+    def close(self) -> None:
+        pass
+
+
+class PytesseractEngine(OcrEngine):
+    """Runs the ``tesseract`` binary per image: writes a temp file, spawns a process and parses stdout."""
+
+    name = "pytesseract"
+
+    def __init__(self, tesseract_cmd: str | None = None) -> None:
+        if tesseract_cmd:
+            pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+
+    @property
+    def tesseract_cmd(self) -> str:
+        return str(pytesseract.pytesseract.tesseract_cmd)
+
+    def version(self) -> str:
+        return str(pytesseract.get_tesseract_version())
+
+    def image_to_string(self, image: np.ndarray) -> str:
+        return pytesseract.image_to_string(image) or ""
+
+
+class TesserocrEngine(OcrEngine):
+    """Calls libtesseract in-process through ``tesserocr``.
+
+    Each thread keeps its own initialised ``PyTessBaseAPI`` (the handle is not thread-safe), so the
+    language model is loaded once per pool worker rather than once per page, and image buffers are
+    passed straight from NumPy without temp files.
+    """
+
+    name = "tesserocr"
+
+    def __init__(self, language: str = "eng") -> None:
+        if not TESSEROCR_AVAILABLE:
+            raise ImportError("tesserocr library not found. Install with: pip install tesserocr")
+        self.language = language
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._handles: list[tesserocr.PyTessBaseAPI] = []
+        self._pid = os.getpid()
+
+    def version(self) -> str:
+        self._api()  # Fails fast when libtesseract or the language data is missing.
+        return tesserocr.tesseract_version().splitlines()[0]
+
+    def image_to_string(self, image: np.ndarray) -> str:
+        if image.ndim == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        image = np.ascontiguousarray(image, dtype=np.uint8)
+        height, width = image.shape[:2]
+        bytes_per_pixel = 1 if image.ndim == 2 else image.shape[2]
+
+        api = self._api()
+        api.SetImageBytes(image.tobytes(), width, height, bytes_per_pixel, width * bytes_per_pixel)
+        try:
+            return api.GetUTF8Text() or ""
+        finally:
+            api.Clear()
+
+    def close(self) -> None:
+        with self._lock:
+            handles, self._handles = self._handles, []
+        for api in handles:
+            api.End()
+        self._local = threading.local()
+
+    def _api(self) -> tesserocr.PyTessBaseAPI:
+        if os.getpid() != self._pid:
+            # Forked pool worker: handles copied from the parent must not be reused.
+            self._pid = os.getpid()
+            self._local = threading.local()
+            self._handles = []
+            self._lock = threading.Lock()
+
+        api = getattr(self._local, "api", None)
+        if api is None:
+            api = tesserocr.PyTessBaseAPI(lang=self.language)
+            self._local.api = api
+            with self._lock:
+                self._handles.append(api)
+        return api
+
+
+def create_ocr_engine(name: str, tesseract_cmd: str | None = None) -> OcrEngine:
+    if name == TesserocrEngine.name:
+        return TesserocrEngine()
+    if name == PytesseractEngine.name:
+        return PytesseractEngine(tesseract_cmd=tesseract_cmd)
+    raise ValueError(f"Unknown OCR engine: {name}")
@@ -1,15 +1,19 @@
 import cv2
 import numpy as np
 
-def detect_panels(image_path: str):
-    # Read the image from the given path.
-    image = cv2.imread(image_path)
+def detect_panels(image: str | np.ndarray):
+    # Accept either a path to read or an already decoded BGR image.
+    if isinstance(image, str):
+        image = cv2.imread(image)
     if image is None:
         return []  # Return empty list if image could not be read.
     
     # Convert image to grayscale.
     gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    
+    return detect_panels_from_gray(gray)
+
+
+def detect_panels_from_gray(gray: np.ndarray):
     # Apply thresholding to invert the image for better contour detection.
     _, thresh = cv2.threshold(gray, 200, 255, cv2.THRESH_BINARY_INV)
     
@@ -0,0 +1,88 @@
+import cv2
+import numpy as np
+
+# Glyph size limits as fractions of the page height.
+MIN_GLYPH_HEIGHT_RATIO = 0.006
+MAX_GLYPH_HEIGHT_RATIO = 0.06
+# Share of bright pixels required around a glyph (speech bubbles are near-white).
+MIN_BRIGHT_SURROUND = 0.55
+# Padding added around each merged region, as a multiple of the median glyph height.
+REGION_PADDING = 0.6
+
+
+def detect_text_regions(gray: np.ndarray) -> list[tuple[int, int, int, int]]:
+    """Candidate text boxes (x, y, w, h) on a grayscale manga page, in reading order.
+
+    Dark glyph-sized connected components sitting on a bright background (speech bubbles,
+    captions) are kept and merged into blocks; artwork strokes fail the size or background tests.
+    """
+    height, width = gray.shape[:2]
+    if height == 0 or width == 0:
+        return []
+
+    # Dark ink strokes and bright paper as binary masks.
+    ink = (gray < 110).astype(np.uint8)
+    bright = (gray > 200).astype(np.uint8)
+
+    count, ink_labels, stats, _ = cv2.connectedComponentsWithStats(ink, connectivity=8)
+    if count <= 1:
+        return []
+    label_ids = np.arange(1, count)
+    stats = stats[1:]  # Drop the background label.
+    xs, ys, ws, hs, areas = (stats[:, i].astype(np.int64) for i in range(5))
+
+    # Glyph-shaped components: bounded height, not too wide, reasonably filled.
+    min_h = max(int(height * MIN_GLYPH_HEIGHT_RATIO), 4)
+    max_h = int(height * MAX_GLYPH_HEIGHT_RATIO)
+    fill = areas / np.maximum(ws * hs, 1)
+    glyph = (hs >= min_h) & (hs <= max_h) & (ws <= max_h * 2) & (fill > 0.08) & (fill < 0.95)
+    if not glyph.any():
+        return []
+    label_ids, xs, ys, ws, hs = label_ids[glyph], xs[glyph], ys[glyph], ws[glyph], hs[glyph]
+
+    # Share of bright pixels in a box around each glyph, via an integral image lookup.
+    margin = hs // 2 + 2
+    x0 = np.clip(xs - margin, 0, width)
+    y0 = np.clip(ys - margin, 0, height)
+    x1 = np.clip(xs + ws + margin, 0, width)
+    y1 = np.clip(ys + hs + margin, 0, height)
+    integral = cv2.integral(bright)
+    bright_sum = integral[y1, x1] - integral[y0, x1] - integral[y1, x0] + integral[y0, x0]
+    surround = bright_sum / np.maximum((x1 - x0) * (y1 - y0), 1)
+    on_paper = surround >= MIN_BRIGHT_SURROUND
+    if not on_paper.any():
+        return []
+    label_ids, xs, ys, ws, hs = label_ids[on_paper], xs[on_paper], ys[on_paper], ws[on_paper], hs[on_paper]
+
+    # Keep only the glyph strokes and dilate so letters merge into words, lines and blocks.
+    glyph_height = int(np.median(hs))
+    keep_label = np.zeros(count, dtype=np.uint8)
+    keep_label[label_ids] = 1
+    mask = keep_label[ink_labels]
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (glyph_height + 1, glyph_height + 1))
+    mask = cv2.dilate(mask, kernel)
+
+    count, labels, region_stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+    if count <= 1:
+        return []
+
+    # Keep regions that hold at least two glyphs; lone specks are usually artwork.
+    centers_y = np.clip(ys + hs // 2, 0, height - 1)
+    centers_x = np.clip(xs + ws // 2, 0, width - 1)
+    glyphs_per_region = np.bincount(labels[centers_y, centers_x], minlength=count)
+    keep = np.flatnonzero(glyphs_per_region[1:] >= 2) + 1
+    if keep.size == 0:
+        return []
+
+    padding = int(glyph_height * REGION_PADDING)
+    regions = []
+    for x, y, w, h in region_stats[keep, :4]:
+        left = max(int(x) - padding, 0)
+        top = max(int(y) - padding, 0)
+        right = min(int(x + w) + padding, width)
+        bottom = min(int(y + h) + padding, height)
+        regions.append((left, top, right - left, bottom - top))
+
+    # Reading order: top-to-bottom bands, right-to-left within a band.
+    band = max(glyph_height * 4, 1)
+    return sorted(regions, key=lambda box: (box[1] // band, -box[0]))
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import wave
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from app.utils.file_storage import ensure_dir, temp_path_for
+
+try:
+    from gtts import gTTS
+    GTTS_AVAILABLE = True
+except ImportError:
+    GTTS_AVAILABLE = False
+
+try:
+    from piper import PiperVoice
+    PIPER_AVAILABLE = True
+except ImportError:
+    PIPER_AVAILABLE = False
+
+
+class TtsEngine(ABC):
+    """Speech synthesis backend used by ``TtsService``. ``synthesize`` blocks and runs on the TTS executor."""
+
+    name = "base"
+    display_name = "base"
+    file_extension = ".mp3"
+
+    @abstractmethod
+    def detect(self) -> dict[str, Any]:
+        """Availability in the shape of the ``/health/tts`` payload."""
+
+    @abstractmethod
+    def resolve_voice(self, voice: str | None) -> str:
+        ...
+
+    @abstractmethod
+    def synthesize(self, text: str, output_path: Path, voice: str) -> None:
+        """Write audio for ``text`` to ``output_path`` atomically (temp file and rename)."""
+
+    def start(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class GttsEngine(TtsEngine):
+    """Google Text-to-Speech over the network; MP3 output."""
+
+    name = "gtts"
+    display_name = "gtts (Google Text-to-Speech)"
+    file_extension = ".mp3"
+    DEFAULT_VOICE = "en"  # gTTS language code
+
+    def detect(self) -> dict[str, Any]:
+        if not GTTS_AVAILABLE:
+            return {
+                "tts_available": False,
+                "engine_name": self.name,
+                "default_voice": self.DEFAULT_VOICE,
+                "error_message": "gtts library not found. Install with: pip install gtts",
+            }
+
+        # gTTS doesn't need model loading, it's ready to go
+        return {
+            "tts_available": True,
+            "engine_name": self.display_name,
+            "default_voice": self.DEFAULT_VOICE,
+            "error_message": None,
+        }
+
+    def resolve_voice(self, voice: str | None) -> str:
+        return voice or self.DEFAULT_VOICE
+
+    def synthesize(self, text: str, output_path: Path, voice: str) -> None:
+        # voice parameter should be a language code (e.g., 'en', 'es', 'fr')
+        lang = voice if isinstance(voice, str) and len(voice) <= 5 else "en"
+        tts = gTTS(text=text, lang=lang, slow=False)
+
+        ensure_dir(output_path.parent)
+        temp_path = temp_path_for(output_path)
+        try:
+            tts.save(str(temp_path))
+            os.replace(temp_path, output_path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+
+class PiperEngine(TtsEngine):
+    """Local Piper neural TTS; no network, WAV output.
+
+    The voice model is loaded once per worker process when the pool starts, so each synthesis only
+    runs inference. Workers return raw 16-bit PCM, which is wrapped in a WAV header here.
+    """
+
+    name = "piper"
+    display_name = "piper (local neural TTS)"
+    file_extension = ".wav"
+
+    def __init__(self, model_path: str, workers: int) -> None:
+        self.model_path = Path(model_path).expanduser()
+        self.workers = max(workers, 1)
+        self._pool: ProcessPoolExecutor | None = None
+
+    @property
+    def voice_name(self) -> str:
+        return self.model_path.stem
+
+    def detect(self) -> dict[str, Any]:
+        error_message = None
+        if not PIPER_AVAILABLE:
+            error_message = "piper-tts library not found. Install with: pip install piper-tts"
+        elif not self.model_path.is_file():
+            error_message = f"Piper voice model not found at {self.model_path}. Run download_piper_voice.py"
+        return {
+            "tts_available": error_message is None,
+            "engine_name": self.display_name if error_message is None else self.name,
+            "default_voice": self.voice_name,
+            "error_message": error_message,
+        }
+
+    def resolve_voice(self, voice: str | None) -> str:
+        # The pool holds a single voice model; the voice only keys the cache.
+        return self.voice_name
+
+    def start(self) -> None:
+        """Spawn the workers now so model loading happens at startup rather than on the first request."""
+        pool = self._get_pool()
+        if not all(future.result() for future in [pool.submit(_piper_ready) for _ in range(self.workers)]):
+            raise RuntimeError(f"Piper voice model at {self.model_path} did not load in every worker")
+
+    def synthesize(self, text: str, output_path: Path, voice: str) -> None:
+        pcm, sample_rate = self._get_pool().submit(_piper_synthesize_pcm, text).result()
+
+        ensure_dir(output_path.parent)
+        temp_path = temp_path_for(output_path)
+        try:
+            with wave.open(str(temp_path), "wb") as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(sample_rate)
+                wav_file.writeframes(pcm)
+            os.replace(temp_path, output_path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # Spawned, not forked, for the same reason as the OCR pool: the API process is multithreaded.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_load_piper_voice,
+                initargs=(str(self.model_path),),
+            )
+        return self._pool
+
+
+_piper_voice: Any = None
+
+
+def _load_piper_voice(model_path: str) -> None:
+    """Pool initializer: load the voice model once for the lifetime of the worker process."""
+    global _piper_voice
+    # Piper looks for <model>.onnx.json; download_piper_voice.py saves <model>.json.
+    config_path = Path(f"{model_path}.json")
+    if not config_path.is_file():
+        config_path = Path(model_path).with_suffix(".json")
+    _piper_voice = PiperVoice.load(model_path, config_path=str(config_path))
+
+
+def _piper_ready() -> bool:
+    return _piper_voice is not None
+
+
+def _piper_synthesize_pcm(text: str) -> tuple[bytes, int]:
+    """Worker entry point: raw mono 16-bit PCM for ``text`` and its sample rate."""
+    sample_rate = _piper_voice.config.sample_rate
+    if hasattr(_piper_voice, "synthesize_stream_raw"):
+        return b"".join(_piper_voice.synthesize_stream_raw(text)), sample_rate
+    # piper-tts >= 1.3 yields AudioChunk objects instead.
+    return b"".join(chunk.audio_int16_bytes for chunk in _piper_voice.synthesize(text)), sample_rate
+
+
+def create_tts_engine(name: str, piper_model_path: str, workers: int) -> TtsEngine:
+    if name == PiperEngine.name:
+        return PiperEngine(model_path=piper_model_path, workers=workers)
+    if name == GttsEngine.name:
+        return GttsEngine()
+    raise ValueError(f"Unknown TTS engine: {name}")
@@ -1,6 +1,7 @@
 from app.services.analysis_service import analysis_service
 from app.services.audio_service import audio_service
 from app.services.chapter_service import chapter_service
+from app.services.job_service import job_service
 from app.services.mangadex_service import mangadex_service
 from app.services.manga_service import manga_service
 from app.services.page_service import page_service
@@ -9,6 +10,7 @@ __all__ = [
     "analysis_service",
     "audio_service",
     "chapter_service",
+    "job_service",
     "mangadex_service",
     "manga_service",
     "page_service",
@@ -1,14 +1,11 @@
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
-
-import httpx
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
 from app.db import models
 from app.ml.panel_detection import detect_panels
+from app.services.image_store import image_store
 from app.services.page_service import page_service
 
 
@@ -19,21 +16,24 @@ class AnalysisService:
             raise HTTPException(status_code=404, detail={"message": "Page not found"})
 
         try:
-            with httpx.Client(timeout=30) as client:
-                response = client.get(page.image_url)
-            response.raise_for_status()
-        except httpx.HTTPError as exc:
-            raise HTTPException(status_code=502, detail={"message": "Failed to download page image for analysis", "error": str(exc)}) from exc
+            panel_boxes = detect_panels(image_store.load_page_image(page=page, db=db))
+        except ValueError:
+            panel_boxes = []  # Undecodable image, same outcome as detect_panels failing to read it.
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg") as temp_image:
-            temp_image.write(response.content)
-            temp_path = Path(temp_image.name)
+        analysis = self.store_panels(page=page, panel_boxes=panel_boxes, db=db)
+        db.commit()
+        db.refresh(analysis)
 
-        try:
-            panel_boxes = detect_panels(str(temp_path))
-        finally:
-            temp_path.unlink(missing_ok=True)
+        return analysis, len(panel_boxes)
 
+    def store_panels(
+        self,
+        page: models.Page,
+        panel_boxes: list[tuple[int, int, int, int]],
+        db: Session,
+        source: str = "panel_detection_basic",
+    ) -> models.PageAnalysis:
+        """Replace the page's panels and add an analysis row. The caller owns the commit."""
         db.query(models.Panel).filter(models.Panel.page_id == page.id).delete()
 
         for index, box in enumerate(panel_boxes):
@@ -54,13 +54,10 @@ class AnalysisService:
             page_id=page.id,
             status="completed" if panel_boxes else "no_panels_detected",
             raw_text=None,
-            source="panel_detection_basic",
+            source=source,
         )
         db.add(analysis)
-        db.commit()
-        db.refresh(analysis)
-
-        return analysis, len(panel_boxes)
+        return analysis
 
 
 analysis_service = AnalysisService()
@@ -2,7 +2,7 @@ from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
 from app.services.chapter_service import chapter_service
-from app.services.ocr_service import ocr_service
+from app.services.chapter_text_service import chapter_text_service
 
 
 class AudioService:
@@ -11,8 +11,8 @@ class AudioService:
         if not chapter:
             raise HTTPException(status_code=404, detail={"message": "Chapter not found"})
 
-        chapter_text = ocr_service.get_chapter_combined_text(chapter_id=chapter_id, db=db)
-        if not chapter_text.strip():
+        chapter_text = chapter_text_service.get(chapter_id=chapter_id, db=db)
+        if not chapter_text.text_length:
             return {
                 "chapter_id": chapter_id,
                 "status": "unavailable",
@@ -26,7 +26,7 @@ class AudioService:
             "status": "ready",
             "message": "OCR text is available. Audio generation can be implemented in a future TTS provider layer.",
             "text_available": True,
-            "chapter_text_length": len(chapter_text),
+            "chapter_text_length": chapter_text.text_length,
         }
 
 
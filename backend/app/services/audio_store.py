@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import hashlib
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db import models
+from app.db.database import SessionLocal, insert_for_dialect
+from app.utils.file_storage import ensure_dir
+
+
+class AudioCacheStore:
+    """Index of generated audio under ``audio_cache_dir``.
+
+    Chapter files (``<chapter_id>/<voice>_<text_hash><ext>``) and shared segments
+    (``segments/<engine>/<voice>/<aa>/<text_hash><ext>``) each have an ``audio_file`` row keyed by
+    their path relative to the cache root, holding size, media type, content hash and last access
+    time. Serving reads that row instead of probing the file, the cache is kept under
+    ``settings.audio_cache_max_bytes`` by evicting least recently used files, and a periodic scan
+    reconciles the index with what is actually on disk.
+    """
+
+    STALE_TEMP_SECONDS = 3600
+    # Serving refreshes last access at most this often, so a player's Range requests are not each a write.
+    TOUCH_INTERVAL_SECONDS = 300
+
+    def __init__(self) -> None:
+        self.root = Path(settings.audio_cache_dir)
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def key_for_path(self, path: str | Path) -> str:
+        return Path(path).resolve().relative_to(self.root.resolve()).as_posix()
+
+    def path_for_key(self, key: str) -> Path:
+        return self.root / key
+
+    def get(self, key: str, db: Session) -> models.AudioFile | None:
+        """Index row for a cached file. A row whose file has gone is dropped, and a cache file that is
+        not indexed yet is indexed now rather than at the next scan."""
+        path = self.path_for_key(key)
+        audio_file = db.get(models.AudioFile, key)
+        if audio_file is not None and not path.is_file():
+            db.delete(audio_file)
+            db.commit()
+            return None
+        if audio_file is None and path.is_file() and self.root.resolve() in path.resolve().parents:
+            metadata = self._metadata_from_key(key)
+            if metadata is not None:
+                self.record(path, db=db, **metadata)
+                db.commit()
+                audio_file = db.get(models.AudioFile, key)
+        return audio_file
+
+    def touch_if_stale(self, audio_file: models.AudioFile, db: Session) -> bool:
+        """Refresh a served file's last access unless it was refreshed within ``TOUCH_INTERVAL_SECONDS``.
+        Returns whether the row changed; the caller commits."""
+        now = datetime.utcnow()
+        if now - audio_file.last_accessed_at < timedelta(seconds=self.TOUCH_INTERVAL_SECONDS):
+            return False
+        audio_file.last_accessed_at = now
+        return True
+
+    def record(
+        self,
+        path: Path,
+        voice: str,
+        text_hash: str,
+        db: Session,
+        engine: str | None = None,
+        chapter_id: str | None = None,
+    ) -> None:
+        """Index a file that was just written; its media type and content hash are computed once here."""
+        now = datetime.utcnow()
+        values = {
+            "chapter_id": chapter_id,
+            "engine": engine,
+            "voice": voice,
+            "text_hash": text_hash,
+            "media_type": detect_media_type(path),
+            "content_hash": file_sha256(path),
+            "size_bytes": path.stat().st_size,
+            "last_accessed_at": now,
+        }
+        statement = insert_for_dialect(models.AudioFile).values(path=self.key_for_path(path), created_at=now, **values)
+        # Re-indexing from a scan knows less than the original write (e.g. no engine); keep what is stored.
+        set_ = {key: value for key, value in values.items() if value is not None}
+        db.execute(statement.on_conflict_do_update(index_elements=[models.AudioFile.path], set_=set_))
+
+    def touch(self, paths: list[Path], db: Session) -> None:
+        keys = [self.key_for_path(path) for path in paths]
+        if keys:
+            db.execute(
+                update(models.AudioFile).where(models.AudioFile.path.in_(keys)).values(last_accessed_at=datetime.utcnow())
+            )
+
+    def remove_superseded(self, chapter_id: str, text_hash: str, db: Session) -> int:
+        """Delete a chapter's audio generated from older text; the caller commits. Returns the removed count."""
+        superseded = (
+            db.query(models.AudioFile.path)
+            .filter(models.AudioFile.chapter_id == chapter_id, models.AudioFile.text_hash != text_hash)
+            .all()
+        )
+        keys = [key for key, in superseded]
+        for key in keys:
+            self.path_for_key(key).unlink(missing_ok=True)
+        if keys:
+            db.query(models.AudioFile).filter(models.AudioFile.path.in_(keys)).delete(synchronize_session=False)
+        return len(keys)
+
+    def total_bytes(self, db: Session) -> int:
+        return int(db.query(func.coalesce(func.sum(models.AudioFile.size_bytes), 0)).scalar())
+
+    def enforce_budget(self, db: Session) -> int:
+        """Evict least recently used files until the cache fits the byte budget. Returns the evicted count."""
+        excess = self.total_bytes(db) - settings.audio_cache_max_bytes
+        if excess <= 0:
+            return 0
+
+        evicted: list[str] = []
+        candidates = (
+            db.query(models.AudioFile.path, models.AudioFile.size_bytes)
+            .order_by(models.AudioFile.last_accessed_at.asc())
+            .all()
+        )
+        for key, size_bytes in candidates:
+            if excess <= 0:
+                break
+            self.path_for_key(key).unlink(missing_ok=True)
+            evicted.append(key)
+            excess -= size_bytes
+
+        db.query(models.AudioFile).filter(models.AudioFile.path.in_(evicted)).delete(synchronize_session=False)
+        db.commit()
+        return len(evicted)
+
+    def scan(self, db: Session) -> dict[str, int]:
+        """Reconcile the index with the disk: index untracked files, drop rows whose file is gone,
+        and delete abandoned temp files and silent fallback audio left by older versions."""
+        ensure_dir(self.root)
+        indexed = {
+            key: (size_bytes, content_hash)
+            for key, size_bytes, content_hash in db.query(
+                models.AudioFile.path, models.AudioFile.size_bytes, models.AudioFile.content_hash
+            )
+        }
+        counts = {"indexed": 0, "removed": 0, "deleted_files": 0}
+        now = time.time()
+
+        on_disk: set[str] = set()
+        for path in self.root.rglob("*"):
+            if not path.is_file():
+                continue
+            if path.name.endswith(".part"):
+                if now - path.stat().st_mtime > self.STALE_TEMP_SECONDS:
+                    path.unlink(missing_ok=True)
+                    counts["deleted_files"] += 1
+                continue
+            if self._is_fallback_audio(path):
+                # Older versions cached a second of silence under the text hash when synthesis failed,
+                # which would otherwise be served as that text's audio forever.
+                path.unlink(missing_ok=True)
+                counts["deleted_files"] += 1
+                continue
+
+            key = self.key_for_path(path)
+            on_disk.add(key)
+            size_bytes, content_hash = indexed.get(key, (None, None))
+            if size_bytes == path.stat().st_size and content_hash:
+                continue
+            metadata = self._metadata_from_key(key)
+            if metadata is None:
+                continue
+            self.record(path, db=db, **metadata)
+            counts["indexed"] += 1
+
+        missing = [key for key in indexed if key not in on_disk]
+        if missing:
+            db.query(models.AudioFile).filter(models.AudioFile.path.in_(missing)).delete(synchronize_session=False)
+        counts["removed"] = len(missing)
+        db.commit()
+        return counts
+
+    def start(self) -> None:
+        """Scan and enforce the budget now and then every ``audio_cache_scan_interval_seconds`` in the background."""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._scan_loop, name="audio-cache-scan", daemon=True)
+        self._thread.start()
+
+    def shutdown(self) -> None:
+        self._stop_event.set()
+        self._thread = None
+
+    def _scan_loop(self) -> None:
+        while not self._stop_event.is_set():
+            db = SessionLocal()
+            try:
+                self.scan(db=db)
+                self.enforce_budget(db=db)
+            except Exception as exc:
+                db.rollback()
+                print(f"⚠️  Audio cache scan failed: {exc}", file=sys.stderr)
+            finally:
+                db.close()
+            self._stop_event.wait(max(settings.audio_cache_scan_interval_seconds, 1))
+
+    def _is_fallback_audio(self, path: Path) -> bool:
+        """Whether ``path`` is the old silent fallback: a 44.1 kHz stereo WAV of zeros (Piper writes mono)."""
+        with path.open("rb") as handle:
+            header = handle.read(44)
+            if header[:4] != b"RIFF" or header[8:16] != b"WAVE" + b"fmt ":
+                return False
+            if int.from_bytes(header[22:24], "little") != 2 or int.from_bytes(header[24:28], "little") != 44100:
+                return False
+            return not any(any(chunk) for chunk in iter(lambda: handle.read(1024 * 1024), b""))
+
+    def _metadata_from_key(self, key: str) -> dict[str, str | None] | None:
+        """Index fields recoverable from a cache path, or None for files the cache did not write."""
+        parts = key.split("/")
+        stem = Path(parts[-1]).stem
+        if parts[0] == "segments" and len(parts) == 5:
+            return {"engine": parts[1], "voice": parts[2], "text_hash": stem, "chapter_id": None}
+        if len(parts) == 2 and "_" in stem:
+            voice, _, text_hash = stem.rpartition("_")
+            return {"engine": None, "voice": voice, "text_hash": text_hash, "chapter_id": parts[0]}
+        return None
+
+
+def detect_media_type(path: Path) -> str:
+    """``audio/wav`` for RIFF files (Piper), otherwise ``audio/mpeg``."""
+    with path.open("rb") as handle:
+        return "audio/wav" if handle.read(4) == b"RIFF" else "audio/mpeg"
+
+
+def file_sha256(path: Path) -> str:
+    hasher = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+audio_store = AudioCacheStore()
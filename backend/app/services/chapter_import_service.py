@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+from urllib.parse import urlsplit
+
+from fastapi import HTTPException
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db import models
+from app.db.database import insert_for_dialect
+from app.services.job_service import JobService, job_service
+from app.services.manga_service import manga_service
+from app.services.mangadex_service import mangadex_service
+
+
+class ChapterImportService:
+    """Stores a MangaDex chapter locally: manga, chapter and page rows written in one transaction."""
+
+    def import_chapter(self, chapter_id: str, quality: str, db: Session) -> dict[str, Any]:
+        """Fetch chapter metadata and at-home image URLs once each, then upsert the manga, chapter and pages.
+
+        Pages are written with one multi-row ``INSERT ... ON CONFLICT DO UPDATE`` containing only new
+        or changed pages, and totals are computed from the rows already read, so storing a chapter is a
+        handful of statements whatever its page count. Queues a prefetch job when ``prefetch_on_store``.
+        """
+        chapter_metadata = mangadex_service.get_chapter_metadata(chapter_id)
+        chapter_data = chapter_metadata.get("data", {})
+        if not chapter_data:
+            raise HTTPException(status_code=404, detail={"message": "Chapter metadata not found"})
+
+        relationships = chapter_data.get("relationships", [])
+        manga_rel = next((rel for rel in relationships if rel.get("type") == "manga"), None)
+        if not manga_rel:
+            raise HTTPException(status_code=404, detail={"message": "Manga relationship not found for chapter"})
+
+        chapter_images_payload = mangadex_service.get_chapter_images(chapter_id=chapter_id, quality=quality)
+        image_urls = chapter_images_payload["image_urls"]
+
+        manga_id = self._upsert_manga(mangadex_manga_id=manga_rel.get("id"), db=db)
+        created_chapter = db.get(models.Chapter, chapter_id) is None
+        self._upsert_chapter(
+            chapter_id=chapter_id,
+            manga_id=manga_id,
+            attrs=chapter_data.get("attributes", {}),
+            chapter_hash=chapter_images_payload["chapter_hash"],
+            db=db,
+        )
+        pages_created, total_pages = self._upsert_pages(chapter_id=chapter_id, image_urls=image_urls, quality=quality, db=db)
+        db.commit()
+
+        if settings.prefetch_on_store:
+            job_service.submit(JobService.KIND_PREFETCH_CHAPTER, chapter_id, db)
+
+        return {
+            "chapter_id": chapter_id,
+            "manga_id": manga_id,
+            "created_chapter": created_chapter,
+            "pages_created": pages_created,
+            "total_pages": total_pages,
+        }
+
+    def _upsert_manga(self, mangadex_manga_id: str, db: Session) -> int:
+        manga = manga_service.get_by_mangadex_id(mangadex_manga_id, db)
+        if manga:
+            return manga.id
+
+        manga_payload = mangadex_service.get_manga(mangadex_manga_id)
+        attrs = manga_payload.get("data", {}).get("attributes", {})
+        title_map = attrs.get("title", {})
+        description_map = attrs.get("description", {})
+        statement = insert_for_dialect(models.Manga).values(
+            title=title_map.get("en") or next(iter(title_map.values()), "Unknown"),
+            author=None,
+            mangadex_id=mangadex_manga_id,
+            description=description_map.get("en") or next(iter(description_map.values()), None),
+            status=attrs.get("status"),
+            cover_url=None,
+            created_at=datetime.utcnow(),
+        )
+        # A concurrent import may have created the manga since the lookup; take its id.
+        statement = statement.on_conflict_do_update(
+            index_elements=[models.Manga.mangadex_id], set_={"mangadex_id": statement.excluded.mangadex_id}
+        )
+        return db.execute(statement.returning(models.Manga.id)).scalar_one()
+
+    def _upsert_chapter(self, chapter_id: str, manga_id: int, attrs: dict[str, Any], chapter_hash: str, db: Session) -> None:
+        values = {
+            "manga_id": manga_id,
+            "volume": attrs.get("volume"),
+            "chapter_number": attrs.get("chapter"),
+            "title": attrs.get("title"),
+            "translated_language": attrs.get("translatedLanguage"),
+            "chapter_hash": chapter_hash,
+        }
+        statement = insert_for_dialect(models.Chapter).values(id=chapter_id, created_at=datetime.utcnow(), **values)
+        db.execute(statement.on_conflict_do_update(index_elements=[models.Chapter.id], set_=values))
+
+    def _upsert_pages(self, chapter_id: str, image_urls: list[str], quality: str, db: Session) -> tuple[int, int]:
+        """Insert new pages and repoint changed ones (dropping their cached image). Returns (created, total).
+
+        At-home URLs carry a per-request node host, so pages are compared on their stable
+        ``/{quality}/{chapter_hash}/{filename}`` part; a page whose node alone changed keeps its cached image
+        and only has its URL refreshed.
+        """
+        existing = {
+            page_number: (page_id, image_url, page_quality)
+            for page_id, page_number, image_url, page_quality in db.query(
+                models.Page.id, models.Page.page_number, models.Page.image_url, models.Page.quality
+            ).filter(models.Page.chapter_id == chapter_id)
+        }
+        now = datetime.utcnow()
+        rows: list[dict[str, Any]] = []
+        moved: list[dict[str, Any]] = []
+        for page_number, image_url in enumerate(image_urls, start=1):
+            current = existing.get(page_number)
+            if current is None or (_image_key(current[1]), current[2]) != (_image_key(image_url), quality):
+                rows.append(
+                    {
+                        "chapter_id": chapter_id,
+                        "page_number": page_number,
+                        "image_url": image_url,
+                        "quality": quality,
+                        "local_image_path": None,
+                        "created_at": now,
+                    }
+                )
+            elif current[1] != image_url:
+                moved.append({"id": current[0], "image_url": image_url})
+
+        if rows:
+            statement = insert_for_dialect(models.Page).values(rows)
+            db.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[models.Page.chapter_id, models.Page.page_number],
+                    set_={
+                        "image_url": statement.excluded.image_url,
+                        "quality": statement.excluded.quality,
+                        "local_image_path": None,
+                    },
+                )
+            )
+        if moved:
+            db.execute(update(models.Page), moved)
+
+        pages_created = sum(1 for row in rows if row["page_number"] not in existing)
+        total_pages = len(existing.keys() | set(range(1, len(image_urls) + 1)))
+        return pages_created, total_pages
+
+
+def _image_key(image_url: str) -> str:
+    """The ``{quality}/{chapter_hash}/{filename}`` tail of an at-home URL, which does not depend on the node."""
+    return "/".join(urlsplit(image_url).path.rsplit("/", 3)[-3:])
+
+
+chapter_import_service = ChapterImportService()
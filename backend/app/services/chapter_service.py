@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from sqlalchemy.orm import Session
 
 from app.db import models
@@ -7,13 +9,35 @@ class ChapterService:
     def get_chapter(self, chapter_id: str, db: Session) -> models.Chapter | None:
         return db.query(models.Chapter).filter(models.Chapter.id == chapter_id).first()
 
-    def list_chapters_for_manga(self, manga_id: int, db: Session) -> list[models.Chapter]:
-        return (
-            db.query(models.Chapter)
-            .filter(models.Chapter.manga_id == manga_id)
-            .order_by(models.Chapter.chapter_number.asc().nullslast(), models.Chapter.created_at.asc())
-            .all()
-        )
+    def list_chapters_for_manga(
+        self, manga_id: int, db: Session, translated_language: str | None = None
+    ) -> list[models.Chapter]:
+        """Chapters in reading order. ``chapter_number`` is text ("10", "10.5"), so it is compared numerically
+        to put "10" after "9"; chapters without a numeric number go last, by creation time."""
+        query = db.query(models.Chapter).filter(models.Chapter.manga_id == manga_id)
+        if translated_language is not None:
+            query = query.filter(models.Chapter.translated_language == translated_language)
+        return sorted(query.all(), key=self._reading_order_key)
+
+    def get_adjacent_chapter_ids(self, chapter: models.Chapter, db: Session) -> tuple[str | None, str | None]:
+        """Previous and next chapter of the same manga and language in ``list_chapters_for_manga`` order."""
+        ordered = [
+            sibling.id
+            for sibling in self.list_chapters_for_manga(
+                manga_id=chapter.manga_id, db=db, translated_language=chapter.translated_language
+            )
+        ]
+        index = ordered.index(chapter.id)
+        prev_chapter_id = ordered[index - 1] if index > 0 else None
+        next_chapter_id = ordered[index + 1] if index + 1 < len(ordered) else None
+        return prev_chapter_id, next_chapter_id
+
+    def _reading_order_key(self, chapter: models.Chapter) -> tuple[float, datetime]:
+        try:
+            number = float(chapter.chapter_number) if chapter.chapter_number else float("inf")
+        except ValueError:
+            number = float("inf")
+        return number, chapter.created_at
 
 
 chapter_service = ChapterService()
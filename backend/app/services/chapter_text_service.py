@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import bisect
+import hashlib
+
+from sqlalchemy.orm import Session
+
+from app.db import models
+from app.services.audio_store import audio_store
+
+
+class ChapterTextService:
+    """Maintains the materialised ``chapter_text`` row that audio lookups read instead of joining page OCR."""
+
+    def hash_text(self, text: str) -> str:
+        """Content hash of chapter text; also the audio cache key, so both must use this function."""
+        return hashlib.md5(text.encode()).hexdigest()[:16]
+
+    def get(self, chapter_id: str, db: Session) -> models.ChapterText:
+        """Single-row lookup; builds the row once for chapters OCR'd before it existed."""
+        chapter_text = db.get(models.ChapterText, chapter_id)
+        if chapter_text is None:
+            chapter_text = self.refresh(chapter_id=chapter_id, db=db)
+            db.commit()
+        return chapter_text
+
+    def refresh(self, chapter_id: str, db: Session) -> models.ChapterText:
+        """Rebuild the row from completed page OCR after page results change; the caller commits."""
+        db.flush()  # Sessions don't autoflush; include the caller's pending page OCR changes.
+        page_texts = (
+            db.query(models.Page.page_number, models.PageOCR.cleaned_text)
+            .join(models.Page, models.Page.id == models.PageOCR.page_id)
+            .filter(models.Page.chapter_id == chapter_id, models.PageOCR.status == "completed")
+            .order_by(models.Page.page_number.asc())
+            .all()
+        )
+        parts = [
+            (page_number, cleaned_text.strip())
+            for page_number, cleaned_text in page_texts
+            if cleaned_text and cleaned_text.strip()
+        ]
+        chapter_text = db.get(models.ChapterText, chapter_id)
+        if chapter_text is None:
+            chapter_text = models.ChapterText(chapter_id=chapter_id)
+            db.add(chapter_text)
+        self._store(
+            chapter_text,
+            text="\n\n".join(part for _, part in parts),
+            page_spans=[[page_number, len(part)] for page_number, part in parts],
+            db=db,
+        )
+        return chapter_text
+
+    def refresh_page(self, page: models.Page, ocr: models.PageOCR, db: Session) -> models.ChapterText:
+        """Replace just ``page``'s part of the row after its OCR result changed; the caller commits.
+
+        Falls back to ``refresh`` for rows built before page spans were stored.
+        """
+        chapter_text = db.get(models.ChapterText, page.chapter_id)
+        if chapter_text is None or chapter_text.page_spans is None:
+            return self.refresh(chapter_id=page.chapter_id, db=db)
+
+        spans = [list(span) for span in chapter_text.page_spans]
+        page_numbers = [page_number for page_number, _ in spans]
+        index = bisect.bisect_left(page_numbers, page.page_number)
+        start = sum(length for _, length in spans[:index]) + 2 * index
+        text = chapter_text.text
+        if index < len(spans) and spans[index][0] == page.page_number:
+            # Drop the old part together with one separator next to it.
+            end = start + spans[index][1]
+            if index + 1 < len(spans):
+                end += 2
+            elif index:
+                start -= 2
+            text = text[:start] + text[end:]
+            del spans[index]
+            start = sum(length for _, length in spans[:index]) + 2 * index
+
+        part = (ocr.cleaned_text or "").strip() if ocr.status == "completed" else ""
+        if part:
+            if spans:
+                # Joined before the next part, or after the last one when this page comes last.
+                text = text[:start] + part + "\n\n" + text[start:] if index < len(spans) else text + "\n\n" + part
+            else:
+                text = part
+            spans.insert(index, [page.page_number, len(part)])
+
+        self._store(chapter_text, text=text, page_spans=spans, db=db)
+        return chapter_text
+
+    def _store(self, chapter_text: models.ChapterText, text: str, page_spans: list[list[int]], db: Session) -> None:
+        text_hash = self.hash_text(text)
+        chapter_text.page_spans = page_spans
+        if chapter_text.text_hash != text_hash:
+            chapter_text.text = text
+            chapter_text.text_length = len(text)
+            chapter_text.text_hash = text_hash
+            # Audio keyed by the previous text can no longer be requested.
+            audio_store.remove_superseded(chapter_id=chapter_text.chapter_id, text_hash=text_hash, db=db)
+        db.flush()
+
+
+chapter_text_service = ChapterTextService()
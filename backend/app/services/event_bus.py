@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+
+class EventBus:
+    """In-process fan-out of events keyed by topic (e.g. a chapter id) to asyncio subscribers.
+
+    ``publish`` may be called from any thread (job workers, request threads); each event is handed to
+    the subscriber's event loop with ``call_soon_threadsafe``. Nothing is buffered for topics without
+    subscribers, so publishing is O(subscribers) and free when nobody listens.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: dict[str, list[tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+
+    @contextmanager
+    def subscribe(self, topic: str) -> Iterator[asyncio.Queue]:
+        """Queue receiving the topic's events until the block exits; must be entered on an event loop."""
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue())
+        with self._lock:
+            self._subscribers.setdefault(topic, []).append(subscriber)
+        try:
+            yield subscriber[1]
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(topic, [])
+                if subscriber in subscribers:
+                    subscribers.remove(subscriber)
+                if not subscribers:
+                    self._subscribers.pop(topic, None)
+
+    def publish(self, topic: str, event: str, data: dict[str, Any]) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(topic, ()))
+        message = {"event": event, "data": data}
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, message)
+            except RuntimeError:
+                pass  # The subscriber's loop has closed; it unsubscribes on exit.
+
+    def has_subscribers(self, topic: str) -> bool:
+        with self._lock:
+            return bool(self._subscribers.get(topic))
+
+
+ocr_events = EventBus()
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from datetime import datetime
+from pathlib import Path
+
+import cv2
+import httpx
+import numpy as np
+from fastapi import HTTPException
+from PIL import Image
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.http_client import http_client
+from app.db import models
+from app.db.database import insert_for_dialect
+from app.utils.file_storage import atomic_write_bytes, ensure_dir, temp_path_for
+
+
+class PageImageStore:
+    """Content-addressed page image cache under ``page_cache_dir/blobs/<aa>/<bb>/<sha256><ext>``.
+
+    Every blob has an ``image_blob`` index row with its size and last access time, and the
+    store is kept under ``settings.page_cache_max_bytes`` by evicting least recently used blobs.
+    Resized or re-encoded derivatives sit next to their blob as ``<sha256>.w<width><ext>``; their
+    combined size is kept in the blob's ``derivative_bytes``, counts against the budget, and they are
+    evicted with it.
+    """
+
+    DERIVATIVE_FORMATS = {
+        "webp": (".webp", [cv2.IMWRITE_WEBP_QUALITY, 80]),
+        "jpeg": (".jpg", [cv2.IMWRITE_JPEG_QUALITY, 85]),
+        "png": (".png", []),
+    }
+    DERIVATIVE_WIDTH_STEP = 64
+
+    def __init__(self) -> None:
+        self.root = Path(settings.page_cache_dir) / "blobs"
+
+    def blob_path(self, digest: str, extension: str) -> Path:
+        return self.root / digest[:2] / digest[2:4] / f"{digest}{extension}"
+
+    def temp_path(self, extension: str) -> Path:
+        """Scratch path inside the store, so a finished download can be renamed into place."""
+        return temp_path_for(ensure_dir(self.root) / f"download{extension}")
+
+    def guess_extension(self, image_url: str) -> str:
+        lowered = image_url.lower()
+        if lowered.endswith(".png"):
+            return ".png"
+        if lowered.endswith(".webp"):
+            return ".webp"
+        return ".jpg"
+
+    def resolve_page_image(self, page: models.Page, db: Session) -> Path:
+        """Local path of a page image, downloading it into the store on a cache miss."""
+        cached_path = self._cached_page_path(page=page, db=db)
+        if cached_path:
+            return cached_path
+
+        local_path, _ = self._download_page_image(page=page, db=db)
+        return local_path
+
+    def load_page_image(self, page: models.Page, db: Session) -> np.ndarray:
+        """Decoded BGR page image; a cache miss is decoded straight from the downloaded bytes."""
+        cached_path = self._cached_page_path(page=page, db=db)
+        if cached_path:
+            image = cv2.imread(str(cached_path))
+        else:
+            _, data = self._download_page_image(page=page, db=db)
+            image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+
+        if image is None:
+            raise ValueError(f"Unable to decode image for page {page.id}")
+        return image
+
+    def put_bytes(self, data: bytes, extension: str, db: Session) -> Path:
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.blob_path(digest, extension)
+        if not path.is_file():
+            atomic_write_bytes(path, data)
+        self._upsert_index(digest=digest, path=path, size_bytes=len(data), db=db)
+        return path
+
+    def put_file(self, temp_path: Path, digest: str, extension: str, db: Session) -> Path:
+        """Move a fully written temp file into the store under its precomputed sha256 digest."""
+        path = self.blob_path(digest, extension)
+        size_bytes = temp_path.stat().st_size
+        if path.is_file():
+            temp_path.unlink(missing_ok=True)
+        else:
+            ensure_dir(path.parent)
+            os.replace(temp_path, path)
+        self._upsert_index(digest=digest, path=path, size_bytes=size_bytes, db=db)
+        return path
+
+    def touch(self, path: str | Path, db: Session) -> None:
+        digest = self.digest_for_path(path)
+        if digest:
+            db.execute(
+                update(models.ImageBlob)
+                .where(models.ImageBlob.digest == digest)
+                .values(last_accessed_at=datetime.utcnow())
+            )
+
+    def digest_for_path(self, path: str | Path) -> str | None:
+        candidate = Path(path)
+        if self.root.resolve() not in candidate.resolve().parents:
+            return None
+        return candidate.stem
+
+    def content_hash(self, path: str | Path) -> str:
+        """sha256 of an image file; free for blobs, whose file name is their digest."""
+        digest = self.digest_for_path(path)
+        if digest:
+            return digest
+
+        hasher = hashlib.sha256()
+        with Path(path).open("rb") as handle:
+            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def derivative(self, page: models.Page, width: int | None, image_format: str | None, db: Session) -> tuple[Path, str]:
+        """(path, ETag value) of a page image at most ``width`` pixels wide in ``image_format``.
+
+        Widths are rounded up to a multiple of ``DERIVATIVE_WIDTH_STEP`` so clients share derivatives,
+        and images are never upscaled. When neither the width nor the format would change, the original
+        blob is returned as is. Each derivative is encoded once and then served from disk.
+        """
+        source_path = self.resolve_page_image(page=page, db=db)
+        digest = self.digest_for_path(source_path)
+        if digest is None:
+            # Images cached before the blob store existed: adopt them, so derivatives have a blob row to count against.
+            source_path = self.put_bytes(source_path.read_bytes(), extension=source_path.suffix, db=db)
+            page.local_image_path = str(source_path)
+            db.commit()
+            digest = source_path.stem
+        if width is not None:
+            width = -(-width // self.DERIVATIVE_WIDTH_STEP) * self.DERIVATIVE_WIDTH_STEP
+            with Image.open(source_path) as header:  # reads the header only
+                if width >= header.width:
+                    width = None
+        extension, encode_params = self.DERIVATIVE_FORMATS[image_format or "jpeg"]
+        if image_format is None:
+            extension = source_path.suffix
+        if width is None and extension == source_path.suffix:
+            return source_path, digest
+
+        path = self.blob_path(digest, f".w{width or 0}{extension}")
+        if not path.is_file():
+            image = cv2.imread(str(source_path), cv2.IMREAD_COLOR)
+            if image is None:
+                raise ValueError(f"Unable to decode image for page {page.id}")
+            if width is not None:
+                height = round(image.shape[0] * width / image.shape[1])
+                image = cv2.resize(image, (width, height), interpolation=cv2.INTER_AREA)
+            ok, encoded = cv2.imencode(extension, image, encode_params if image_format else [])
+            if not ok:
+                raise ValueError(f"Unable to encode {extension} derivative for page {page.id}")
+            atomic_write_bytes(path, encoded.tobytes())
+            derivative_bytes = sum(sibling.stat().st_size for sibling in path.parent.glob(f"{digest}.w[0-9]*"))
+            db.execute(
+                update(models.ImageBlob)
+                .where(models.ImageBlob.digest == digest)
+                .values(derivative_bytes=derivative_bytes)
+            )
+            db.commit()
+            self.enforce_budget(db=db)
+        return path, f"{digest}-{path.name.split('.', 1)[1]}"
+
+    def total_bytes(self, db: Session) -> int:
+        """Bytes held by the store: blobs plus their derivatives."""
+        return int(
+            db.query(
+                func.coalesce(func.sum(models.ImageBlob.size_bytes + models.ImageBlob.derivative_bytes), 0)
+            ).scalar()
+        )
+
+    def enforce_budget(self, db: Session) -> int:
+        """Evict least recently used blobs until the store fits the byte budget. Returns the evicted count."""
+        excess = self.total_bytes(db) - settings.page_cache_max_bytes
+        if excess <= 0:
+            return 0
+
+        evicted: list[str] = []
+        candidates = (
+            db.query(
+                models.ImageBlob.digest,
+                models.ImageBlob.path,
+                models.ImageBlob.size_bytes + models.ImageBlob.derivative_bytes,
+            )
+            .order_by(models.ImageBlob.last_accessed_at.asc())
+            .all()
+        )
+        for digest, path, size_bytes in candidates:
+            if excess <= 0:
+                break
+            Path(path).unlink(missing_ok=True)
+            for derivative_path in Path(path).parent.glob(f"{digest}.w[0-9]*"):
+                derivative_path.unlink(missing_ok=True)
+            db.execute(update(models.Page).where(models.Page.local_image_path == path).values(local_image_path=None))
+            evicted.append(digest)
+            excess -= size_bytes
+
+        db.query(models.ImageBlob).filter(models.ImageBlob.digest.in_(evicted)).delete(synchronize_session=False)
+        db.commit()
+        return len(evicted)
+
+    def _cached_page_path(self, page: models.Page, db: Session) -> Path | None:
+        if not page.local_image_path:
+            return None
+
+        local_path = Path(page.local_image_path)
+        if not local_path.is_file():
+            return None
+
+        self.touch(local_path, db=db)
+        db.commit()
+        return local_path
+
+    def _download_page_image(self, page: models.Page, db: Session) -> tuple[Path, bytes]:
+        try:
+            response = http_client.get(page.image_url, timeout=max(settings.request_timeout_seconds, 30))
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            raise HTTPException(status_code=502, detail={"message": "Failed to download page image", "error": str(exc)}) from exc
+
+        local_path = self.put_bytes(response.content, extension=self.guess_extension(page.image_url), db=db)
+        page.local_image_path = str(local_path)
+        db.commit()
+        self.enforce_budget(db=db)
+        return local_path, response.content
+
+    def _upsert_index(self, digest: str, path: Path, size_bytes: int, db: Session) -> None:
+        now = datetime.utcnow()
+        statement = insert_for_dialect(models.ImageBlob).values(
+            digest=digest,
+            path=str(path),
+            size_bytes=size_bytes,
+            last_accessed_at=now,
+            created_at=now,
+        )
+        db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[models.ImageBlob.digest],
+                set_={"path": str(path), "size_bytes": size_bytes, "last_accessed_at": now},
+            )
+        )
+
+
+image_store = PageImageStore()
@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import sys
+import threading
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db import models
+from app.db.database import SessionLocal
+from app.services.analysis_service import analysis_service
+from app.services.chapter_text_service import chapter_text_service
+from app.services.ocr_service import ocr_service
+from app.services.page_pipeline_service import page_pipeline_service
+from app.services.prefetch_service import prefetch_service
+from app.services.tts_service import tts_service
+
+ProgressCallback = Callable[[int, int], None]
+JobHandler = Callable[[models.Job, Session, ProgressCallback], dict[str, Any]]
+
+
+class JobService:
+    KIND_OCR_CHAPTER = "ocr_chapter"
+    KIND_ANALYSIS_PAGE = "analysis_page"
+    KIND_AUDIO_CHAPTER = "audio_chapter"
+    KIND_PREFETCH_CHAPTER = "prefetch_chapter"
+    KIND_PIPELINE_CHAPTER = "pipeline_chapter"
+    ACTIVE_STATUSES = ("queued", "running")
+    PRIORITY_DEFAULT = 0
+    PRIORITY_LOW = 10
+    # Queue entry that stops a worker; it sorts after every job, so queued jobs run first.
+    _STOP = (sys.maxsize, 0)
+
+    def __init__(self) -> None:
+        self._handlers: dict[str, JobHandler] = {}
+        self._worker_counts: dict[str, int] = {}
+        self._queues: dict[str, queue.PriorityQueue[tuple[int, int]]] = {}
+        self._threads: list[threading.Thread] = []
+        self._submit_lock = threading.Lock()
+        self._started = False
+
+    def register(self, kind: str, handler: JobHandler, max_workers: int) -> None:
+        self._handlers[kind] = handler
+        self._worker_counts[kind] = max(max_workers, 1)
+
+    def start(self) -> None:
+        """Spawn the per-kind worker threads and re-queue jobs left unfinished by a previous process."""
+        if self._started:
+            return
+
+        for kind, worker_count in self._worker_counts.items():
+            self._queues[kind] = queue.PriorityQueue()
+            for index in range(worker_count):
+                thread = threading.Thread(target=self._worker_loop, args=(kind,), name=f"job-{kind}-{index}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        self._started = True
+
+        db = SessionLocal()
+        try:
+            unfinished = (
+                db.query(models.Job)
+                .filter(models.Job.status.in_(self.ACTIVE_STATUSES))
+                .order_by(models.Job.id.asc())
+                .all()
+            )
+            for job in unfinished:
+                if job.kind not in self._handlers:
+                    job.status = "failed"
+                    job.error_message = f"Unknown job kind: {job.kind}"
+                    job.finished_at = datetime.utcnow()
+                    continue
+                job.status = "queued"
+                job.started_at = None
+                job.progress_current = 0
+            db.commit()
+            for job in unfinished:
+                if job.status == "queued":
+                    self._queues[job.kind].put((job.priority, job.id))
+        finally:
+            db.close()
+
+    def shutdown(self) -> None:
+        if not self._started:
+            return
+
+        for kind, worker_queue in self._queues.items():
+            for _ in range(self._worker_counts[kind]):
+                worker_queue.put(self._STOP)
+        self._threads.clear()
+        self._queues.clear()
+        self._started = False
+
+    def submit(
+        self,
+        kind: str,
+        target_id: str,
+        db: Session,
+        payload: dict[str, Any] | None = None,
+        priority: int = PRIORITY_DEFAULT,
+    ) -> tuple[models.Job, bool]:
+        """Queue a job, or return the in-flight job for the same kind and target. The flag is True when reused.
+
+        An in-flight job with different options is a 409 rather than a silent reuse, since its result
+        would not be the one asked for. A reused job that is still queued is raised to ``priority`` when
+        that is more urgent, and takes over chained stages it does not have yet (see ``submit_chain``).
+        Workers take queued jobs of their kind lowest ``priority`` first, then in submission order.
+        """
+        if kind not in self._handlers:
+            raise HTTPException(status_code=422, detail={"message": f"Unknown job kind: {kind}"})
+
+        with self._submit_lock:
+            existing = (
+                db.query(models.Job)
+                .filter(
+                    models.Job.kind == kind,
+                    models.Job.target_id == target_id,
+                    models.Job.status.in_(self.ACTIVE_STATUSES),
+                )
+                .order_by(models.Job.id.desc())
+                .first()
+            )
+            if existing:
+                if _job_options(existing.payload) != _job_options(payload):
+                    raise HTTPException(
+                        status_code=409,
+                        detail={
+                            "message": f"Job {existing.id} ({kind} for {target_id}) is already {existing.status} with different options",
+                            "job_id": existing.id,
+                        },
+                    )
+                if payload and payload.get("then") and not (existing.payload or {}).get("then"):
+                    existing.payload = {**(existing.payload or {}), "then": payload["then"]}
+                reprioritised = existing.status == "queued" and priority < existing.priority
+                if reprioritised:
+                    existing.priority = priority
+                db.commit()
+                if self._started and reprioritised:
+                    # The old queue entry stays behind and is skipped once the job is no longer queued.
+                    self._queues[kind].put((existing.priority, existing.id))
+                return existing, True
+
+            job = models.Job(kind=kind, target_id=target_id, status="queued", payload=payload, priority=priority)
+            db.add(job)
+            db.commit()
+            db.refresh(job)
+
+        if self._started:
+            self._queues[kind].put((job.priority, job.id))
+        return job, False
+
+    def submit_chain(
+        self,
+        stages: list[tuple[str, dict[str, Any] | None]],
+        target_id: str,
+        db: Session,
+        priority: int = PRIORITY_DEFAULT,
+    ) -> tuple[models.Job, bool]:
+        """Queue ``(kind, payload)`` stages to run one after another for ``target_id``, each on its own kind's
+        workers at ``priority``. The first stage is submitted now and carries the rest under ``payload["then"]``;
+        every later stage is submitted when the one before it completes, and a failed stage ends the chain.
+        The chain's priority travels with the stages, so joining an in-flight job that runs at another
+        priority does not change it. Returns ``submit``'s result for the first stage."""
+        (kind, payload), rest = stages[0], stages[1:]
+        if rest:
+            then = [
+                {"kind": next_kind, "payload": next_payload, "priority": priority} for next_kind, next_payload in rest
+            ]
+            payload = {**(payload or {}), "then": then}
+        return self.submit(kind, target_id, db, payload=payload, priority=priority)
+
+    def get_job(self, job_id: int, db: Session) -> models.Job:
+        job = db.query(models.Job).filter(models.Job.id == job_id).first()
+        if not job:
+            raise HTTPException(status_code=404, detail={"message": "Job not found"})
+        return job
+
+    def _worker_loop(self, kind: str) -> None:
+        worker_queue = self._queues[kind]
+        while True:
+            entry = worker_queue.get()
+            if entry == self._STOP:
+                return
+            _, job_id = entry
+            try:
+                self._run_job(job_id)
+            except Exception as exc:
+                print(f"⚠️  Job {job_id} crashed outside its handler: {exc}", file=sys.stderr)
+
+    def _run_job(self, job_id: int) -> None:
+        db = SessionLocal()
+        try:
+            job = db.query(models.Job).filter(models.Job.id == job_id).first()
+            if not job or job.status != "queued":
+                return
+
+            job.status = "running"
+            job.started_at = datetime.utcnow()
+            job.error_message = None
+            db.commit()
+
+            def report_progress(current: int, total: int) -> None:
+                job.progress_current = current
+                job.progress_total = total
+                db.commit()
+
+            try:
+                result = self._handlers[job.kind](job, db, report_progress)
+                job.status = "completed"
+                job.result = result
+            except HTTPException as exc:
+                db.rollback()
+                job.status = "failed"
+                job.error_message = exc.detail.get("message", str(exc.detail)) if isinstance(exc.detail, dict) else str(exc.detail)
+            except Exception as exc:
+                db.rollback()
+                job.status = "failed"
+                job.error_message = str(exc)
+
+            job.finished_at = datetime.utcnow()
+            db.commit()
+            if job.status == "completed":
+                self._submit_next_stage(job, db)
+        finally:
+            db.close()
+
+    def _submit_next_stage(self, job: models.Job, db: Session) -> None:
+        """Submit the first of a completed job's chained stages, handing it the remaining ones."""
+        # Read after the final commit, so stages attached by a concurrent submit are seen too.
+        stages = (job.payload or {}).get("then") or []
+        if not stages:
+            return
+        try:
+            self.submit_chain(
+                [(stage["kind"], stage.get("payload")) for stage in stages],
+                job.target_id,
+                db,
+                priority=stages[0].get("priority", job.priority),
+            )
+        except HTTPException as exc:
+            message = exc.detail.get("message", str(exc.detail)) if isinstance(exc.detail, dict) else str(exc.detail)
+            print(f"⚠️  Job {job.id} could not queue its next stage ({stages[0]['kind']}): {message}", file=sys.stderr)
+
+
+def _run_ocr_chapter_job(job: models.Job, db: Session, report_progress: ProgressCallback) -> dict[str, Any]:
+    payload = job.payload or {}
+    return ocr_service.run_chapter_ocr(
+        chapter_id=job.target_id,
+        db=db,
+        parallel=payload.get("parallel", True),
+        on_progress=report_progress,
+        mode=payload.get("mode", "page"),
+        force=payload.get("force", False),
+    )
+
+
+def _run_analysis_page_job(job: models.Job, db: Session, report_progress: ProgressCallback) -> dict[str, Any]:
+    report_progress(0, 1)
+    analysis, panel_count = analysis_service.analyze_page(page_id=int(job.target_id), db=db)
+    report_progress(1, 1)
+    return {
+        "page_id": analysis.page_id,
+        "analysis_id": analysis.id,
+        "status": analysis.status,
+        "source": analysis.source,
+        "panel_count": panel_count,
+    }
+
+
+def _run_audio_chapter_job(job: models.Job, db: Session, report_progress: ProgressCallback) -> dict[str, Any]:
+    payload = job.payload or {}
+    report_progress(0, 1)
+    if payload.get("text"):
+        result = asyncio.run(tts_service.generate_chapter_audio(chapter_id=job.target_id, chapter_text=payload["text"]))
+    else:
+        chapter_text = chapter_text_service.get(chapter_id=job.target_id, db=db)
+        result = asyncio.run(
+            tts_service.generate_chapter_audio(
+                chapter_id=job.target_id, chapter_text=chapter_text.text, text_hash=chapter_text.text_hash
+            )
+        )
+    report_progress(1, 1)
+    return result
+
+
+def _run_prefetch_chapter_job(job: models.Job, db: Session, report_progress: ProgressCallback) -> dict[str, Any]:
+    report_progress(0, 1)
+    result = prefetch_service.prefetch_chapter(chapter_id=job.target_id, db=db)
+    report_progress(1, 1)
+    return result
+
+
+def _run_pipeline_chapter_job(job: models.Job, db: Session, report_progress: ProgressCallback) -> dict[str, Any]:
+    return page_pipeline_service.process_chapter(chapter_id=job.target_id, db=db, on_progress=report_progress)
+
+
+def _job_options(payload: dict[str, Any] | None) -> dict[str, Any] | None:
+    """A job payload without its chained stages: what decides whether two jobs do the same work."""
+    options = {key: value for key, value in (payload or {}).items() if key != "then"}
+    return options or None
+
+
+job_service = JobService()
+job_service.register(JobService.KIND_OCR_CHAPTER, _run_ocr_chapter_job, settings.job_ocr_workers)
+job_service.register(JobService.KIND_ANALYSIS_PAGE, _run_analysis_page_job, settings.job_analysis_workers)
+job_service.register(JobService.KIND_AUDIO_CHAPTER, _run_audio_chapter_job, settings.job_audio_workers)
+job_service.register(JobService.KIND_PREFETCH_CHAPTER, _run_prefetch_chapter_job, settings.job_prefetch_workers)
+job_service.register(JobService.KIND_PIPELINE_CHAPTER, _run_pipeline_chapter_job, settings.job_ocr_workers)
@@ -6,6 +6,7 @@ import httpx
 from fastapi import HTTPException
 
 from app.core.config import settings
+from app.core.http_client import http_client
 
 
 class MangaDexService:
@@ -17,8 +18,7 @@ class MangaDexService:
     def _get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         url = f"{self.base_url}{path}"
         try:
-            with httpx.Client(timeout=self.timeout, headers={"User-Agent": "automated-manga-reader-mvp/0.1"}) as client:
-                response = client.get(url, params=params)
+            response = http_client.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
             return response.json()
         except httpx.HTTPStatusError as exc:
@@ -99,8 +99,7 @@ class MangaDexService:
 
         url = f"{self.at_home_base_url}/{chapter_id}"
         try:
-            with httpx.Client(timeout=self.timeout, headers={"User-Agent": "automated-manga-reader-mvp/0.1"}) as client:
-                response = client.get(url)
+            response = http_client.get(url, timeout=self.timeout)
             response.raise_for_status()
             payload = response.json()
         except httpx.HTTPStatusError as exc:
@@ -1,32 +1,46 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import multiprocessing
 import re
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Any
 
 import cv2
-import httpx
 import numpy as np
-import pytesseract
 from fastapi import HTTPException
 from pytesseract.pytesseract import TesseractNotFoundError
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.db import models
+from app.ml.ocr_engines import OcrEngine, PytesseractEngine, create_ocr_engine
+from app.ml.panel_detection import detect_panels_from_gray
+from app.ml.text_regions import detect_text_regions
+from app.services.analysis_service import analysis_service
 from app.services.chapter_service import chapter_service
+from app.services.chapter_text_service import chapter_text_service
+from app.services.event_bus import ocr_events
+from app.services.image_store import image_store
 from app.services.page_service import page_service
-from app.utils.file_storage import ensure_dir
 
 
 class OcrService:
     VALID_STATUSES = {"pending", "processing", "completed", "failed"}
     DEPENDENCY_ERROR_MESSAGE = "OCR cannot run because Tesseract OCR is not installed/configured on the backend."
+    CONFIG_VERSION = 1  # Bump when preprocessing or text assembly changes, so incremental runs redo every page.
 
     def __init__(self) -> None:
-        if settings.tesseract_cmd:
-            pytesseract.pytesseract.tesseract_cmd = settings.tesseract_cmd
+        self._engine, self._engine_fallback_reason = self._create_engine()
         self._dependency_status = self._detect_tesseract_dependency()
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._panel_executor: ThreadPoolExecutor | None = None
 
     def refresh_dependency_status(self) -> dict[str, Any]:
         self._dependency_status = self._detect_tesseract_dependency()
@@ -50,87 +64,351 @@ class OcrService:
             },
         )
 
-    def run_page_ocr(self, page_id: int, db: Session) -> models.PageOCR:
+    def config_hash(self, mode: str) -> str:
+        """Fingerprint of everything besides the image that determines a page's OCR output."""
+        fingerprint = json.dumps(
+            {
+                "engine": self.engine_name,
+                "engine_version": self._dependency_status.get("tesseract_version"),
+                "mode": mode,
+                "config_version": self.CONFIG_VERSION,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+    def run_page_ocr(
+        self,
+        page_id: int,
+        db: Session,
+        mode: str = "page",
+        refresh_chapter_text: bool = True,
+    ) -> models.PageOCR:
         self.ensure_tesseract_available()
         page = page_service.get_page(page_id=page_id, db=db)
         if not page:
             raise HTTPException(status_code=404, detail={"message": "Page not found"})
 
-        ocr = db.query(models.PageOCR).filter(models.PageOCR.page_id == page.id).first()
-        if not ocr:
-            ocr = models.PageOCR(page_id=page.id, status="pending", engine_name=settings.ocr_engine_name)
-            db.add(ocr)
-            db.commit()
-            db.refresh(ocr)
-
+        started = time.perf_counter()
+        ocr = self.get_or_create_page_ocr(page=page, db=db)
         ocr.status = "processing"
         ocr.error_message = None
         db.commit()
+        self._publish_page(page=page, ocr=ocr)
 
         try:
             image_path = self._resolve_local_image(page=page, db=db)
-            raw_text = self._extract_raw_text_from_image(image_path=image_path)
-            cleaned_text = self._normalize_text(raw_text)
-
-            ocr.status = "completed"
-            ocr.raw_text = raw_text
-            ocr.cleaned_text = cleaned_text
-            ocr.engine_name = settings.ocr_engine_name
-            ocr.error_message = None
-            db.commit()
-            db.refresh(ocr)
-            return ocr
+            if mode == "panels":
+                raw_text = self._extract_panel_text(page=page, image_path=image_path, db=db)
+            elif mode == "regions":
+                raw_text = self._extract_region_text(image_path=image_path, parallel=True)
+            else:
+                raw_text = self._extract_raw_text_from_image(image_path=image_path)
+            self.mark_completed(
+                ocr=ocr,
+                raw_text=raw_text,
+                image_hash=image_store.content_hash(image_path),
+                config_hash=self.config_hash(mode),
+            )
         except HTTPException as exc:
-            ocr.status = "failed"
-            ocr.raw_text = None
-            ocr.cleaned_text = None
-            ocr.engine_name = settings.ocr_engine_name
-            error_message = "Unable to resolve image for OCR"
-            if isinstance(exc.detail, dict):
-                error_message = exc.detail.get("message", error_message)
-            elif isinstance(exc.detail, str):
-                error_message = exc.detail
-            ocr.error_message = error_message
-            db.commit()
-            db.refresh(ocr)
-            return ocr
+            self.mark_failed(ocr=ocr, error_message=self.http_error_message(exc))
         except Exception as exc:
-            ocr.status = "failed"
-            ocr.raw_text = None
-            ocr.cleaned_text = None
-            ocr.engine_name = settings.ocr_engine_name
-            ocr.error_message = str(exc)
-            db.commit()
-            db.refresh(ocr)
-            return ocr
+            self.mark_failed(ocr=ocr, error_message=str(exc))
 
-    def run_chapter_ocr(self, chapter_id: str, db: Session) -> dict[str, int]:
+        if refresh_chapter_text:
+            chapter_text_service.refresh_page(page=page, ocr=ocr, db=db)
+        db.commit()
+        db.refresh(ocr)
+        self._publish_page(page=page, ocr=ocr, elapsed_ms=self._elapsed_ms(started))
+        return ocr
+
+    def run_chapter_ocr(
+        self,
+        chapter_id: str,
+        db: Session,
+        parallel: bool = True,
+        on_progress: Callable[[int, int], None] | None = None,
+        mode: str = "page",
+        force: bool = False,
+    ) -> dict[str, Any]:
+        """OCR a chapter's pages. Unless forced, pages already completed for the same image and config are skipped."""
         self.ensure_tesseract_available()
         chapter = chapter_service.get_chapter(chapter_id=chapter_id, db=db)
         if not chapter:
             raise HTTPException(status_code=404, detail={"message": "Chapter not found"})
 
-        pages = page_service.list_pages_for_chapter(chapter_id=chapter_id, db=db)
-        pages_processed = 0
-        success_count = 0
-        failure_count = 0
+        started = time.perf_counter()
+        all_pages = page_service.list_pages_for_chapter(chapter_id=chapter_id, db=db)
+        config_hash = self.config_hash(mode)
+        up_to_date = set() if force else self._up_to_date_page_ids(pages=all_pages, config_hash=config_hash, db=db)
+        pages = [page for page in all_pages if page.id not in up_to_date]
+        skipped_count = len(all_pages) - len(pages)
+        workers = max(settings.ocr_max_workers, 1)
+        if not (parallel and workers > 1 and len(pages) > 1):
+            workers = 1
+        ocr_events.publish(
+            chapter_id,
+            "started",
+            {
+                "chapter_id": chapter_id,
+                "mode": mode,
+                "pages_total": len(all_pages),
+                "pages_queued": len(pages),
+                "skipped_count": skipped_count,
+            },
+        )
 
-        for page in pages:
-            pages_processed += 1
-            result = self.run_page_ocr(page_id=page.id, db=db)
-            if result.status == "completed":
-                success_count += 1
-            elif result.status == "failed":
-                failure_count += 1
+        try:
+            if workers > 1:
+                page_timings = self._run_pages_in_process_pool(pages=pages, db=db, on_progress=on_progress, mode=mode)
+            else:
+                page_timings = []
+                for page in pages:
+                    page_started = time.perf_counter()
+                    result = self.run_page_ocr(page_id=page.id, db=db, mode=mode, refresh_chapter_text=False)
+                    page_timings.append(
+                        {
+                            "page_id": page.id,
+                            "page_number": page.page_number,
+                            "status": result.status,
+                            "elapsed_ms": self._elapsed_ms(page_started),
+                        }
+                    )
+                    if on_progress:
+                        on_progress(len(page_timings), len(pages))
+        except Exception as exc:
+            ocr_events.publish(chapter_id, "error", {"chapter_id": chapter_id, "message": str(exc)})
+            raise
+        finally:
+            chapter_text_service.refresh(chapter_id=chapter_id, db=db)
+            db.commit()
 
-        return {
+        success_count = sum(1 for timing in page_timings if timing["status"] == "completed")
+        failure_count = sum(1 for timing in page_timings if timing["status"] == "failed")
+
+        summary = {
             "chapter_id": chapter_id,
-            "pages_processed": pages_processed,
+            "pages_processed": len(page_timings),
             "success_count": success_count,
             "failure_count": failure_count,
-            "completed_count": success_count,
+            "skipped_count": skipped_count,
+            "completed_count": success_count + skipped_count,
+            "mode": mode,
+            "workers": workers,
+            "elapsed_ms": self._elapsed_ms(started),
+        }
+        ocr_events.publish(chapter_id, "summary", summary)
+        return {**summary, "page_timings": page_timings}
+
+    def _up_to_date_page_ids(self, pages: list[models.Page], config_hash: str, db: Session) -> set[int]:
+        """Ids of pages whose completed OCR row matches ``config_hash`` and the page's current image.
+
+        The OCR rows come from one query; cached images are hashed in place (free for blobs), and only
+        pages whose image is not cached go through the store, which downloads it.
+        """
+        image_hashes = dict(
+            db.query(models.PageOCR.page_id, models.PageOCR.image_hash).filter(
+                models.PageOCR.page_id.in_([page.id for page in pages]),
+                models.PageOCR.status == "completed",
+                models.PageOCR.config_hash == config_hash,
+                models.PageOCR.image_hash.isnot(None),
+            )
+        )
+        up_to_date: set[int] = set()
+        for page in pages:
+            if page.id not in image_hashes:
+                continue
+            if page.local_image_path and Path(page.local_image_path).is_file():
+                image_path = Path(page.local_image_path)
+            else:
+                try:
+                    image_path = self._resolve_local_image(page=page, db=db)
+                except HTTPException:
+                    continue
+            if image_store.content_hash(image_path) == image_hashes[page.id]:
+                up_to_date.add(page.id)
+        return up_to_date
+
+    def shutdown(self) -> None:
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+        if self._panel_executor is not None:
+            self._panel_executor.shutdown(wait=False, cancel_futures=True)
+            self._panel_executor = None
+        self._engine.close()
+
+    def _run_pages_in_process_pool(
+        self,
+        pages: list[models.Page],
+        db: Session,
+        on_progress: Callable[[int, int], None] | None = None,
+        mode: str = "page",
+    ) -> list[dict[str, Any]]:
+        """OCR pages on the worker pool; images are resolved and rows are written here in the main process."""
+        ocr_by_page_id: dict[int, models.PageOCR] = {}
+        for page in pages:
+            ocr = self.get_or_create_page_ocr(page=page, db=db)
+            ocr.status = "processing"
+            ocr.error_message = None
+            ocr_by_page_id[page.id] = ocr
+        db.commit()
+        for page in pages:
+            self._publish_page(page=page, ocr=ocr_by_page_id[page.id])
+
+        panels_by_page_id: dict[int, list[models.Panel]] = {}
+        if mode == "panels":
+            for panel in self._load_panels(page_ids=[page.id for page in pages], db=db):
+                panels_by_page_id.setdefault(panel.page_id, []).append(panel)
+
+        timings_by_page_id: dict[int, dict[str, Any]] = {}
+        image_hashes: dict[int, str] = {}
+        futures: dict[Future, models.Page] = {}
+        config_hash = self.config_hash(mode)
+        pool = self.get_process_pool()
+
+        for page in pages:
+            ocr = ocr_by_page_id[page.id]
+            try:
+                image_path = self._resolve_local_image(page=page, db=db)
+            except HTTPException as exc:
+                self.mark_failed(ocr=ocr, error_message=self.http_error_message(exc))
+                db.commit()
+                timings_by_page_id[page.id] = self._page_timing(page=page, status=ocr.status, elapsed_seconds=0.0)
+                self._publish_page(page=page, ocr=ocr, elapsed_ms=0.0)
+                if on_progress:
+                    on_progress(len(timings_by_page_id), len(pages))
+                continue
+            image_hashes[page.id] = image_store.content_hash(image_path)
+            if mode == "panels":
+                panel_boxes = [self._panel_box(panel) for panel in panels_by_page_id.get(page.id, [])] or None
+                futures[pool.submit(_extract_panel_text_in_worker, str(image_path), panel_boxes)] = page
+            elif mode == "regions":
+                futures[pool.submit(_extract_region_text_in_worker, str(image_path))] = page
+            else:
+                futures[pool.submit(_extract_text_in_worker, str(image_path))] = page
+
+        for future in as_completed(futures):
+            page = futures[future]
+            ocr = ocr_by_page_id[page.id]
+            elapsed_seconds = 0.0
+            try:
+                if mode == "panels":
+                    panel_boxes, panel_texts, elapsed_seconds = future.result()
+                    raw_text = self._store_panel_text(
+                        page=page,
+                        panels=panels_by_page_id.get(page.id, []),
+                        panel_boxes=panel_boxes,
+                        panel_texts=panel_texts,
+                        db=db,
+                    )
+                else:
+                    raw_text, elapsed_seconds = future.result()
+                self.mark_completed(ocr=ocr, raw_text=raw_text, image_hash=image_hashes[page.id], config_hash=config_hash)
+            except BrokenProcessPool as exc:
+                self._process_pool = None
+                self.mark_failed(ocr=ocr, error_message=f"OCR worker pool crashed: {exc}")
+            except Exception as exc:
+                self.mark_failed(ocr=ocr, error_message=str(exc))
+            db.commit()
+            timings_by_page_id[page.id] = self._page_timing(page=page, status=ocr.status, elapsed_seconds=elapsed_seconds)
+            self._publish_page(page=page, ocr=ocr, elapsed_ms=timings_by_page_id[page.id]["elapsed_ms"])
+            if on_progress:
+                on_progress(len(timings_by_page_id), len(pages))
+
+        return [timings_by_page_id[page.id] for page in pages]
+
+    def get_process_pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            # Spawn rather than fork: the server process already runs job, TTS and scan threads, and a
+            # forked child inherits their locks (including OpenCV's and the DB pool's) in whatever state they were.
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=max(settings.ocr_max_workers, 1), mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._process_pool
+
+    def _get_panel_executor(self) -> ThreadPoolExecutor:
+        if self._panel_executor is None:
+            self._panel_executor = ThreadPoolExecutor(max_workers=max(settings.ocr_panel_workers, 1), thread_name_prefix="ocr-panel")
+        return self._panel_executor
+
+    def get_or_create_page_ocr(self, page: models.Page, db: Session) -> models.PageOCR:
+        ocr = db.query(models.PageOCR).filter(models.PageOCR.page_id == page.id).first()
+        if not ocr:
+            ocr = models.PageOCR(page_id=page.id, status="pending", engine_name=self.engine_name)
+            db.add(ocr)
+            db.flush()
+        return ocr
+
+    def mark_completed(
+        self,
+        ocr: models.PageOCR,
+        raw_text: str,
+        image_hash: str | None = None,
+        config_hash: str | None = None,
+    ) -> None:
+        ocr.status = "completed"
+        ocr.raw_text = raw_text
+        ocr.cleaned_text = self._normalize_text(raw_text)
+        ocr.engine_name = self.engine_name
+        ocr.error_message = None
+        ocr.image_hash = image_hash
+        ocr.config_hash = config_hash
+
+    def mark_failed(self, ocr: models.PageOCR, error_message: str) -> None:
+        ocr.status = "failed"
+        ocr.raw_text = None
+        ocr.cleaned_text = None
+        ocr.engine_name = self.engine_name
+        ocr.error_message = error_message
+
+    def http_error_message(self, exc: HTTPException) -> str:
+        if isinstance(exc.detail, dict):
+            return exc.detail.get("message", "Unable to resolve image for OCR")
+        if isinstance(exc.detail, str):
+            return exc.detail
+        return "Unable to resolve image for OCR"
+
+    def _page_timing(self, page: models.Page, status: str, elapsed_seconds: float) -> dict[str, Any]:
+        return {
+            "page_id": page.id,
+            "page_number": page.page_number,
+            "status": status,
+            "elapsed_ms": round(elapsed_seconds * 1000, 1),
         }
 
+    def _publish_page(self, page: models.Page, ocr: models.PageOCR, elapsed_ms: float | None = None) -> None:
+        """Push a page status transition to ``/ocr/chapter/{id}/events`` subscribers."""
+        ocr_events.publish(
+            page.chapter_id,
+            "page",
+            {
+                "page_id": page.id,
+                "page_number": page.page_number,
+                "status": ocr.status,
+                "text_length": len((ocr.cleaned_text or "").strip()),
+                "error_message": ocr.error_message,
+                "elapsed_ms": elapsed_ms,
+            },
+        )
+
+    def get_chapter_status_counts(self, chapter_id: str, db: Session) -> dict[str, int]:
+        """Page OCR status counts for a chapter from one grouped query; pages without an OCR row are pending."""
+        rows = (
+            db.query(func.coalesce(models.PageOCR.status, "pending"), func.count(models.Page.id))
+            .select_from(models.Page)
+            .outerjoin(models.PageOCR, models.PageOCR.page_id == models.Page.id)
+            .filter(models.Page.chapter_id == chapter_id)
+            .group_by(func.coalesce(models.PageOCR.status, "pending"))
+            .all()
+        )
+        counts = {status: 0 for status in ("pending", "processing", "completed", "failed")}
+        counts.update({status: count for status, count in rows})
+        return counts
+
+    def _elapsed_ms(self, started: float) -> float:
+        return round((time.perf_counter() - started) * 1000, 1)
+
     def get_page_ocr(self, page_id: int, db: Session) -> tuple[models.Page, models.PageOCR | None]:
         page = page_service.get_page(page_id=page_id, db=db)
         if not page:
@@ -163,7 +441,7 @@ class OcrService:
             status = ocr.status if ocr else "pending"
             cleaned_text = ocr.cleaned_text if ocr else None
             raw_text = ocr.raw_text if ocr else None
-            engine_name = ocr.engine_name if ocr else settings.ocr_engine_name
+            engine_name = ocr.engine_name if ocr else self.engine_name
             error_message = ocr.error_message if ocr else None
 
             if status == "completed":
@@ -192,15 +470,12 @@ class OcrService:
             )
 
         chapter_text = "\n\n".join(chapter_parts).strip()
-        overall_status = "completed"
-        if failed_count > 0 and completed_count == 0:
-            overall_status = "failed"
-        elif processing_count > 0:
-            overall_status = "processing"
-        elif pending_count > 0 and completed_count == 0:
-            overall_status = "pending"
-        elif pending_count > 0 or failed_count > 0:
-            overall_status = "partial"
+        overall_status = self.overall_status(
+            completed_count=completed_count,
+            failed_count=failed_count,
+            processing_count=processing_count,
+            pending_count=pending_count,
+        )
 
         return {
             "chapter_id": chapter_id,
@@ -215,72 +490,229 @@ class OcrService:
             "page_results": page_results,
         }
 
+    def get_chapter_ocr_summary(self, chapter_id: str, db: Session, include_text: bool = False) -> dict[str, Any]:
+        """Chapter OCR status without text payloads: counts from one grouped query and per-page
+        lengths projected in SQL. Cleaned text is selected only when ``include_text`` is set."""
+        chapter = chapter_service.get_chapter(chapter_id=chapter_id, db=db)
+        if not chapter:
+            raise HTTPException(status_code=404, detail={"message": "Chapter not found"})
+
+        counts = self.get_chapter_status_counts(chapter_id=chapter_id, db=db)
+        columns = [
+            models.Page.id,
+            models.Page.page_number,
+            func.coalesce(models.PageOCR.status, "pending"),
+            func.coalesce(func.length(models.PageOCR.cleaned_text), 0),
+            models.PageOCR.error_message,
+        ]
+        if include_text:
+            columns.append(models.PageOCR.cleaned_text)
+        rows = (
+            db.query(*columns)
+            .outerjoin(models.PageOCR, models.PageOCR.page_id == models.Page.id)
+            .filter(models.Page.chapter_id == chapter_id)
+            .order_by(models.Page.page_number.asc())
+            .all()
+        )
+
+        page_results: list[dict[str, Any]] = []
+        chapter_parts: list[str] = []
+        text_lengths: list[int] = []
+        for row in rows:
+            page_id, page_number, status, text_length, error_message = row[:5]
+            cleaned_text = row[5] if include_text else None
+            if status == "completed" and text_length:
+                text_lengths.append(text_length)
+                if include_text:
+                    chapter_parts.append(cleaned_text)
+            page_results.append(
+                {
+                    "page_id": page_id,
+                    "page_number": page_number,
+                    "status": status,
+                    "text_length": text_length,
+                    "error_message": error_message,
+                    "cleaned_text": cleaned_text,
+                }
+            )
+
+        # Cleaned text is stored stripped, so the joined length follows from the page lengths.
+        chapter_text_length = sum(text_lengths) + 2 * max(len(text_lengths) - 1, 0)
+        return {
+            "chapter_id": chapter_id,
+            "status": self.overall_status(
+                completed_count=counts["completed"],
+                failed_count=counts["failed"],
+                processing_count=counts["processing"],
+                pending_count=counts["pending"],
+            ),
+            "pages_total": len(rows),
+            "completed_count": counts["completed"],
+            "failed_count": counts["failed"],
+            "processing_count": counts["processing"],
+            "pending_count": counts["pending"],
+            "chapter_text": "\n\n".join(chapter_parts) if include_text else None,
+            "chapter_text_length": chapter_text_length,
+            "page_results": page_results,
+        }
+
+    def overall_status(self, completed_count: int, failed_count: int, processing_count: int, pending_count: int) -> str:
+        if failed_count > 0 and completed_count == 0:
+            return "failed"
+        if processing_count > 0:
+            return "processing"
+        if pending_count > 0 and completed_count == 0:
+            return "pending"
+        if pending_count > 0 or failed_count > 0:
+            return "partial"
+        return "completed"
+
     def get_chapter_combined_text(self, chapter_id: str, db: Session) -> str:
-        chapter_ocr = self.get_chapter_ocr(chapter_id=chapter_id, db=db)
-        return chapter_ocr["chapter_text"]
+        return chapter_text_service.get(chapter_id=chapter_id, db=db).text
 
     def _resolve_local_image(self, page: models.Page, db: Session) -> Path:
-        if page.local_image_path:
-            local_path = Path(page.local_image_path)
-            if local_path.exists() and local_path.is_file():
-                return local_path
-
-        cache_root = ensure_dir(settings.page_cache_dir)
-        chapter_dir = ensure_dir(cache_root / page.chapter_id)
-        extension = self._guess_image_extension(page.image_url)
-        local_path = chapter_dir / f"{page.page_number:04d}{extension}"
-
-        if local_path.exists() and local_path.is_file():
-            page.local_image_path = str(local_path)
-            db.commit()
-            return local_path
-
-        try:
-            with httpx.Client(timeout=max(settings.request_timeout_seconds, 30)) as client:
-                response = client.get(page.image_url)
-            response.raise_for_status()
-        except httpx.HTTPError as exc:
-            raise HTTPException(status_code=502, detail={"message": "Failed to download page image", "error": str(exc)}) from exc
-
-        local_path.write_bytes(response.content)
-        page.local_image_path = str(local_path)
-        db.commit()
-        return local_path
+        return image_store.resolve_page_image(page=page, db=db)
 
     def _extract_raw_text_from_image(self, image_path: Path) -> str:
         image = cv2.imread(str(image_path))
         if image is None:
             raise ValueError(f"Unable to load image for OCR: {image_path}")
 
-        processed = self._preprocess_image(image)
-        raw_text = pytesseract.image_to_string(processed)
-        return raw_text or ""
+        return self._engine.image_to_string(self._preprocess_image(image))
 
-    def _detect_tesseract_dependency(self) -> dict[str, Any]:
-        tesseract_cmd = str(pytesseract.pytesseract.tesseract_cmd)
+    def _extract_panel_text(self, page: models.Page, image_path: Path, db: Session) -> str:
+        gray = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
+        if gray is None:
+            raise ValueError(f"Unable to load image for OCR: {image_path}")
+
+        panels = self._load_panels(page_ids=[page.id], db=db)
+        panel_boxes = [self._panel_box(panel) for panel in panels] or None
+        panel_boxes, panel_texts = self._ocr_panel_crops(gray=gray, panel_boxes=panel_boxes, parallel=True)
+        return self._store_panel_text(page=page, panels=panels, panel_boxes=panel_boxes, panel_texts=panel_texts, db=db)
+
+    def _ocr_panel_crops(
+        self,
+        gray: np.ndarray,
+        panel_boxes: list[tuple[int, int, int, int]] | None,
+        parallel: bool,
+    ) -> tuple[list[tuple[int, int, int, int]], list[str]]:
+        """OCR each panel crop in reading order, detecting panels when none are stored.
+
+        A page without detectable panels is OCR'd whole and returned with no boxes.
+        """
+        if panel_boxes is None:
+            panel_boxes = [tuple(int(value) for value in box) for box in detect_panels_from_gray(gray)]
+        if not panel_boxes:
+            return [], [self.extract_text_from_gray(gray)]
+
+        return panel_boxes, self._ocr_crops(gray=gray, boxes=panel_boxes, parallel=parallel)
+
+    def _extract_region_text(self, image_path: Path, parallel: bool) -> str:
+        """OCR only the detected text regions of a page; a page with no candidate regions yields no text."""
+        gray = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
+        if gray is None:
+            raise ValueError(f"Unable to load image for OCR: {image_path}")
+
+        region_texts = self._ocr_crops(gray=gray, boxes=detect_text_regions(gray), parallel=parallel)
+        return "\n\n".join(text.strip() for text in region_texts if text.strip())
+
+    def _ocr_crops(self, gray: np.ndarray, boxes: list[tuple[int, int, int, int]], parallel: bool) -> list[str]:
+        crops = [gray[y : y + height, x : x + width] for x, y, width, height in boxes]
+        if parallel and len(crops) > 1:
+            return list(self._get_panel_executor().map(self.extract_text_from_gray, crops))
+        return [self.extract_text_from_gray(crop) for crop in crops]
+
+    def _store_panel_text(
+        self,
+        page: models.Page,
+        panels: list[models.Panel],
+        panel_boxes: list[tuple[int, int, int, int]],
+        panel_texts: list[str],
+        db: Session,
+    ) -> str:
+        """Write per-panel text and return the page text joined in reading order."""
+        if not panel_boxes:
+            return panel_texts[0] if panel_texts else ""
+
+        if not panels:
+            analysis_service.store_panels(page=page, panel_boxes=panel_boxes, db=db, source="ocr_panels")
+            db.flush()
+            panels = self._load_panels(page_ids=[page.id], db=db)
+
+        for panel, text in zip(panels, panel_texts):
+            panel.extracted_text = self._normalize_text(text)
+        return "\n\n".join(text.strip() for text in panel_texts if text.strip())
+
+    def _load_panels(self, page_ids: list[int], db: Session) -> list[models.Panel]:
+        if not page_ids:
+            return []
+        return (
+            db.query(models.Panel)
+            .filter(models.Panel.page_id.in_(page_ids))
+            .order_by(models.Panel.page_id, func.coalesce(models.Panel.reading_order, models.Panel.panel_index))
+            .all()
+        )
+
+    def _panel_box(self, panel: models.Panel) -> tuple[int, int, int, int]:
+        return panel.x, panel.y, panel.width, panel.height
+
+    def extract_text_from_gray(self, gray: np.ndarray) -> str:
+        """OCR an already decoded grayscale page, for callers that share one decode with other stages."""
+        return self._engine.image_to_string(self._preprocess_gray(gray))
 
+    @property
+    def engine_name(self) -> str:
+        return self._engine.name
+
+    def _create_engine(self) -> tuple[OcrEngine, str | None]:
+        """The configured OCR engine, or the pytesseract engine with the reason it could not be used."""
+        try:
+            return create_ocr_engine(settings.ocr_engine_name, tesseract_cmd=settings.tesseract_cmd), None
+        except (ImportError, ValueError) as exc:
+            return PytesseractEngine(tesseract_cmd=settings.tesseract_cmd), str(exc)
+
+    def _detect_tesseract_dependency(self) -> dict[str, Any]:
+        if not isinstance(self._engine, PytesseractEngine):
+            try:
+                self._engine.version()
+            except Exception as exc:
+                self._engine.close()
+                self._engine = PytesseractEngine(tesseract_cmd=settings.tesseract_cmd)
+                self._engine_fallback_reason = f"{settings.ocr_engine_name} unavailable: {exc}"
+
+        if isinstance(self._engine, PytesseractEngine):
+            tesseract_cmd = self._engine.tesseract_cmd
+        else:
+            # In-process engines have no binary; report the one pytesseract would run.
+            tesseract_cmd = settings.tesseract_cmd or "tesseract"
+        engine_status = {"engine_name": self.engine_name, "engine_fallback_reason": self._engine_fallback_reason}
         try:
-            pytesseract.get_tesseract_version()
             return {
                 "tesseract_available": True,
                 "tesseract_cmd": tesseract_cmd,
+                "tesseract_version": self._engine.version(),
                 "error_message": None,
+                **engine_status,
             }
         except TesseractNotFoundError as exc:
             return {
                 "tesseract_available": False,
                 "tesseract_cmd": tesseract_cmd,
                 "error_message": str(exc),
+                **engine_status,
             }
         except Exception as exc:
             return {
                 "tesseract_available": False,
                 "tesseract_cmd": tesseract_cmd,
                 "error_message": f"Unexpected Tesseract validation error: {exc}",
+                **engine_status,
             }
 
     def _preprocess_image(self, image: np.ndarray) -> np.ndarray:
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        return self._preprocess_gray(cv2.cvtColor(image, cv2.COLOR_BGR2GRAY))
+
+    def _preprocess_gray(self, gray: np.ndarray) -> np.ndarray:
         normalized = cv2.normalize(gray, None, alpha=0, beta=255, norm_type=cv2.NORM_MINMAX)
         denoised = cv2.GaussianBlur(normalized, (3, 3), 0)
         thresholded = cv2.adaptiveThreshold(
@@ -308,13 +740,32 @@ class OcrService:
         non_empty_lines = [line for line in lines if line]
         return "\n".join(non_empty_lines).strip()
 
-    def _guess_image_extension(self, image_url: str) -> str:
-        lowered = image_url.lower()
-        if lowered.endswith(".png"):
-            return ".png"
-        if lowered.endswith(".webp"):
-            return ".webp"
-        return ".jpg"
-
 
 ocr_service = OcrService()
+
+
+def _extract_text_in_worker(image_path: str) -> tuple[str, float]:
+    """Process pool entry point: preprocess and OCR one page image, returning the text and elapsed seconds."""
+    started = time.perf_counter()
+    raw_text = ocr_service._extract_raw_text_from_image(image_path=Path(image_path))
+    return raw_text, time.perf_counter() - started
+
+
+def _extract_region_text_in_worker(image_path: str) -> tuple[str, float]:
+    """Process pool entry point for region mode: OCR the detected text regions of one page."""
+    started = time.perf_counter()
+    raw_text = ocr_service._extract_region_text(image_path=Path(image_path), parallel=False)
+    return raw_text, time.perf_counter() - started
+
+
+def _extract_panel_text_in_worker(
+    image_path: str,
+    panel_boxes: list[tuple[int, int, int, int]] | None,
+) -> tuple[list[tuple[int, int, int, int]], list[str], float]:
+    """Process pool entry point for panel mode: returns the panel boxes used, their texts and elapsed seconds."""
+    started = time.perf_counter()
+    gray = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+    if gray is None:
+        raise ValueError(f"Unable to load image for OCR: {image_path}")
+    panel_boxes, panel_texts = ocr_service._ocr_panel_crops(gray=gray, panel_boxes=panel_boxes, parallel=False)
+    return panel_boxes, panel_texts, time.perf_counter() - started
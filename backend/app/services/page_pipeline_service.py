@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, as_completed
+from typing import Any
+
+import cv2
+import numpy as np
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.db import models
+from app.ml.panel_detection import detect_panels_from_gray
+from app.services.analysis_service import analysis_service
+from app.services.chapter_service import chapter_service
+from app.services.chapter_text_service import chapter_text_service
+from app.services.image_store import image_store
+from app.services.ocr_service import ocr_service
+from app.services.page_service import page_service
+
+PanelBox = tuple[int, int, int, int]
+
+
+class PagePipelineService:
+    """Decode a page once, then run panel detection and OCR from the same grayscale array."""
+
+    SOURCE = "page_pipeline"
+
+    def process_page(self, page_id: int, db: Session) -> dict[str, Any]:
+        ocr_service.ensure_tesseract_available()
+        page = page_service.get_page(page_id=page_id, db=db)
+        if not page:
+            raise HTTPException(status_code=404, detail={"message": "Page not found"})
+
+        started = time.perf_counter()
+        try:
+            image_path = image_store.resolve_page_image(page=page, db=db)
+            panel_boxes, raw_text = _process_page_in_worker(str(image_path))
+        except HTTPException as exc:
+            result = self._store_failure(page=page, error_message=ocr_service.http_error_message(exc), started=started, db=db)
+        except Exception as exc:
+            result = self._store_failure(page=page, error_message=str(exc), started=started, db=db)
+        else:
+            result = self._store_success(
+                page=page,
+                panel_boxes=panel_boxes,
+                raw_text=raw_text,
+                image_hash=image_store.content_hash(image_path),
+                started=started,
+                db=db,
+            )
+
+        chapter_text_service.refresh_page(page=page, ocr=ocr_service.get_or_create_page_ocr(page=page, db=db), db=db)
+        db.commit()
+        return result
+
+    def process_chapter(
+        self,
+        chapter_id: str,
+        db: Session,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> dict[str, Any]:
+        """Run the pipeline for every page on the OCR process pool; rows are written here in the main process."""
+        ocr_service.ensure_tesseract_available()
+        chapter = chapter_service.get_chapter(chapter_id=chapter_id, db=db)
+        if not chapter:
+            raise HTTPException(status_code=404, detail={"message": "Chapter not found"})
+
+        started = time.perf_counter()
+        pages = page_service.list_pages_for_chapter(chapter_id=chapter_id, db=db)
+        results_by_page_id: dict[int, dict[str, Any]] = {}
+        futures: dict[Future, tuple[models.Page, str, float]] = {}
+        pool = ocr_service.get_process_pool()
+
+        def record(page: models.Page, result: dict[str, Any]) -> None:
+            results_by_page_id[page.id] = result
+            if on_progress:
+                on_progress(len(results_by_page_id), len(pages))
+
+        for page in pages:
+            page_started = time.perf_counter()
+            try:
+                image_path = image_store.resolve_page_image(page=page, db=db)
+            except HTTPException as exc:
+                error_message = ocr_service.http_error_message(exc)
+                record(page, self._store_failure(page=page, error_message=error_message, started=page_started, db=db))
+                continue
+            image_hash = image_store.content_hash(image_path)
+            futures[pool.submit(_process_page_in_worker, str(image_path))] = (page, image_hash, page_started)
+
+        for future in as_completed(futures):
+            page, image_hash, page_started = futures[future]
+            try:
+                panel_boxes, raw_text = future.result()
+            except Exception as exc:
+                record(page, self._store_failure(page=page, error_message=str(exc), started=page_started, db=db))
+                continue
+            record(
+                page,
+                self._store_success(
+                    page=page,
+                    panel_boxes=panel_boxes,
+                    raw_text=raw_text,
+                    image_hash=image_hash,
+                    started=page_started,
+                    db=db,
+                ),
+            )
+
+        chapter_text_service.refresh(chapter_id=chapter_id, db=db)
+        db.commit()
+        page_results = [results_by_page_id[page.id] for page in pages]
+        success_count = sum(1 for result in page_results if result["ocr_status"] == "completed")
+        return {
+            "chapter_id": chapter_id,
+            "pages_processed": len(page_results),
+            "success_count": success_count,
+            "failure_count": len(page_results) - success_count,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+            "page_results": page_results,
+        }
+
+    def _store_success(
+        self,
+        page: models.Page,
+        panel_boxes: list[PanelBox],
+        raw_text: str,
+        image_hash: str,
+        started: float,
+        db: Session,
+    ) -> dict[str, Any]:
+        """Store panels and OCR text; the OCR row is stamped like a page-mode run so incremental OCR skips it."""
+        analysis = analysis_service.store_panels(page=page, panel_boxes=panel_boxes, db=db, source=self.SOURCE)
+        ocr = ocr_service.get_or_create_page_ocr(page=page, db=db)
+        ocr_service.mark_completed(
+            ocr=ocr, raw_text=raw_text, image_hash=image_hash, config_hash=ocr_service.config_hash("page")
+        )
+        db.commit()
+        return self._page_result(page=page, analysis=analysis, ocr=ocr, panel_count=len(panel_boxes), started=started)
+
+    def _store_failure(self, page: models.Page, error_message: str, started: float, db: Session) -> dict[str, Any]:
+        analysis = models.PageAnalysis(page_id=page.id, status="failed", raw_text=None, source=self.SOURCE)
+        db.add(analysis)
+        ocr = ocr_service.get_or_create_page_ocr(page=page, db=db)
+        ocr_service.mark_failed(ocr=ocr, error_message=error_message)
+        db.commit()
+        return self._page_result(page=page, analysis=analysis, ocr=ocr, panel_count=0, started=started)
+
+    def _page_result(
+        self,
+        page: models.Page,
+        analysis: models.PageAnalysis,
+        ocr: models.PageOCR,
+        panel_count: int,
+        started: float,
+    ) -> dict[str, Any]:
+        return {
+            "page_id": page.id,
+            "page_number": page.page_number,
+            "analysis_status": analysis.status,
+            "panel_count": panel_count,
+            "ocr_status": ocr.status,
+            "text_length": len((ocr.cleaned_text or "").strip()),
+            "error_message": ocr.error_message,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+
+
+def _analyze_gray(gray: np.ndarray) -> tuple[list[PanelBox], str]:
+    panel_boxes = [tuple(int(value) for value in box) for box in detect_panels_from_gray(gray)]
+    return panel_boxes, ocr_service.extract_text_from_gray(gray)
+
+
+def _process_page_in_worker(image_path: str) -> tuple[list[PanelBox], str]:
+    """Process pool entry point (also run inline for single pages): one grayscale decode feeds both stages."""
+    gray = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+    if gray is None:
+        raise ValueError(f"Unable to load image for processing: {image_path}")
+    return _analyze_gray(gray)
+
+
+page_pipeline_service = PagePipelineService()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+from fastapi import HTTPException
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.http_client import http_client
+from app.db import models
+from app.services.chapter_service import chapter_service
+from app.services.image_store import image_store
+from app.services.page_service import page_service
+
+
+class PrefetchService:
+    CHUNK_SIZE = 64 * 1024
+
+    def prefetch_chapter(self, chapter_id: str, db: Session) -> dict[str, Any]:
+        return asyncio.run(self.prefetch_chapter_async(chapter_id=chapter_id, db=db))
+
+    async def prefetch_chapter_async(self, chapter_id: str, db: Session) -> dict[str, Any]:
+        """Download uncached page images concurrently into the image store and record their paths in one update."""
+        chapter = chapter_service.get_chapter(chapter_id=chapter_id, db=db)
+        if not chapter:
+            raise HTTPException(status_code=404, detail={"message": "Chapter not found"})
+
+        started = time.perf_counter()
+        pages = page_service.list_pages_for_chapter(chapter_id=chapter_id, db=db)
+        downloads = [
+            page for page in pages if not (page.local_image_path and Path(page.local_image_path).is_file())
+        ]
+        cached_count = len(pages) - len(downloads)
+        path_updates: list[dict[str, Any]] = []
+        failures: dict[int, str] = {}
+
+        if downloads:
+            semaphore = asyncio.Semaphore(max(settings.prefetch_concurrency, 1))
+            async with http_client.async_client() as client:
+                results = await asyncio.gather(
+                    *(self._download(client, semaphore, page.image_url) for page in downloads),
+                    return_exceptions=True,
+                )
+            for page, result in zip(downloads, results):
+                if isinstance(result, BaseException):
+                    failures[page.id] = str(result)
+                    continue
+                temp_path, digest = result
+                local_path = image_store.put_file(
+                    temp_path, digest=digest, extension=image_store.guess_extension(page.image_url), db=db
+                )
+                path_updates.append({"id": page.id, "local_image_path": str(local_path)})
+
+        if path_updates:
+            db.execute(update(models.Page), path_updates)
+        db.commit()
+        if path_updates:
+            image_store.enforce_budget(db=db)
+
+        return {
+            "chapter_id": chapter_id,
+            "pages_total": len(pages),
+            "downloaded_count": len(downloads) - len(failures),
+            "cached_count": cached_count,
+            "failed_count": len(failures),
+            "failed_page_ids": sorted(failures),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+
+    async def _download(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, url: str) -> tuple[Path, str]:
+        async with semaphore:
+            max_retries = max(settings.http_retry_attempts, 0)
+            attempt = 0
+            while True:
+                try:
+                    return await self._stream_to_temp_file(client, url)
+                except httpx.HTTPStatusError as exc:
+                    if exc.response.status_code not in http_client.RETRY_STATUS_CODES or attempt >= max_retries:
+                        raise
+                    await asyncio.sleep(http_client.backoff_seconds(attempt, exc.response))
+                except httpx.TransportError:
+                    if attempt >= max_retries:
+                        raise
+                    await asyncio.sleep(http_client.backoff_seconds(attempt))
+                attempt += 1
+
+    async def _stream_to_temp_file(self, client: httpx.AsyncClient, url: str) -> tuple[Path, str]:
+        """Stream a response into a scratch file in the image store, hashing it on the way."""
+        temp_path = image_store.temp_path(image_store.guess_extension(url))
+        digest = hashlib.sha256()
+        try:
+            async with client.stream("GET", url, timeout=max(settings.request_timeout_seconds, 30)) as response:
+                response.raise_for_status()
+                with temp_path.open("wb") as handle:
+                    async for chunk in response.aiter_bytes(self.CHUNK_SIZE):
+                        digest.update(chunk)
+                        handle.write(chunk)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        return temp_path, digest.hexdigest()
+
+
+prefetch_service = PrefetchService()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import HTTPException
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.db import models
+from app.services.chapter_service import chapter_service
+from app.services.chapter_text_service import chapter_text_service
+from app.services.ocr_service import ocr_service
+from app.services.tts_service import tts_service
+
+
+class ReaderService:
+    def get_chapter_bundle(self, chapter_id: str, db: Session) -> dict[str, Any]:
+        """Everything the reader needs to open a chapter, from four queries: the chapter, its pages
+        joined with their OCR rows, the materialised chapter text row and the sibling chapter list."""
+        chapter = chapter_service.get_chapter(chapter_id=chapter_id, db=db)
+        if not chapter:
+            raise HTTPException(status_code=404, detail={"message": "Chapter not found"})
+
+        rows = (
+            db.query(
+                models.Page,
+                func.coalesce(models.PageOCR.status, "pending"),
+                models.PageOCR.cleaned_text,
+                models.PageOCR.error_message,
+            )
+            .outerjoin(models.PageOCR, models.PageOCR.page_id == models.Page.id)
+            .filter(models.Page.chapter_id == chapter_id)
+            .order_by(models.Page.page_number.asc())
+            .all()
+        )
+
+        counts = {"completed": 0, "failed": 0, "processing": 0, "pending": 0}
+        pages: list[dict[str, Any]] = []
+        page_results: list[dict[str, Any]] = []
+        for page, status, cleaned_text, error_message in rows:
+            counts[status] = counts.get(status, 0) + 1
+            pages.append(
+                {
+                    "id": page.id,
+                    "chapter_id": page.chapter_id,
+                    "page_number": page.page_number,
+                    "image_url": page.image_url,
+                    "quality": page.quality,
+                    "local_image_path": page.local_image_path,
+                    "created_at": page.created_at,
+                    "ocr_text": cleaned_text,
+                }
+            )
+            page_results.append(
+                {
+                    "page_id": page.id,
+                    "page_number": page.page_number,
+                    "status": status,
+                    "text_length": len((cleaned_text or "").strip()),
+                    "error_message": error_message,
+                }
+            )
+
+        chapter_text = chapter_text_service.get(chapter_id=chapter_id, db=db)
+        prev_chapter_id, next_chapter_id = chapter_service.get_adjacent_chapter_ids(chapter=chapter, db=db)
+        return {
+            "chapter": chapter,
+            "pages": pages,
+            "ocr": {
+                "chapter_id": chapter_id,
+                "status": ocr_service.overall_status(
+                    completed_count=counts["completed"],
+                    failed_count=counts["failed"],
+                    processing_count=counts["processing"],
+                    pending_count=counts["pending"],
+                ),
+                "pages_total": len(rows),
+                "completed_count": counts["completed"],
+                "failed_count": counts["failed"],
+                "processing_count": counts["processing"],
+                "pending_count": counts["pending"],
+                "chapter_text_length": chapter_text.text_length,
+                "page_results": page_results,
+            },
+            "audio": tts_service.get_chapter_audio_status(
+                chapter_id=chapter_id, text_hash=chapter_text.text_hash, text_length=chapter_text.text_length
+            ),
+            "prev_chapter_id": prev_chapter_id,
+            "next_chapter_id": next_chapter_id,
+        }
+
+
+reader_service = ReaderService()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import math
+from datetime import datetime, timedelta
+from typing import Any
+
+from fastapi import HTTPException
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db import models
+from app.services.chapter_service import chapter_service
+from app.services.job_service import JobService, job_service
+
+
+class ReadingProgressService:
+    def record(self, chapter_id: str, page_number: int, db: Session) -> dict[str, Any]:
+        """Store the reader's page in a chapter. Once it passes ``settings.warmup_threshold`` of the pages,
+        queue a low-priority warm-up of the next chapter, at most once per chapter (see ``_warmup_due``).
+
+        The warm-up is a job chain on the regular queues: prefetch, then incremental OCR, then audio,
+        each behind any interactive job of its kind. ``warmup_job_id`` tracks the prefetch stage.
+        """
+        chapter = chapter_service.get_chapter(chapter_id=chapter_id, db=db)
+        if not chapter:
+            raise HTTPException(status_code=404, detail={"message": "Chapter not found"})
+
+        pages_total = db.query(func.count(models.Page.id)).filter(models.Page.chapter_id == chapter_id).scalar()
+        if page_number > pages_total:
+            raise HTTPException(
+                status_code=422,
+                detail={"message": f"Page {page_number} is out of range for a chapter with {pages_total} pages"},
+            )
+
+        progress = db.get(models.ReadingProgress, chapter_id)
+        if progress is None:
+            progress = models.ReadingProgress(chapter_id=chapter_id, manga_id=chapter.manga_id)
+            db.add(progress)
+        progress.page_number = page_number
+
+        _, next_chapter_id = chapter_service.get_adjacent_chapter_ids(chapter=chapter, db=db)
+        warmup_job = db.get(models.Job, progress.warmup_job_id) if progress.warmup_job_id else None
+        threshold_page = max(math.ceil(pages_total * settings.warmup_threshold), 1)
+        if next_chapter_id and page_number >= threshold_page and self._warmup_due(warmup_job):
+            warmup_job, _ = job_service.submit_chain(
+                [
+                    (JobService.KIND_PREFETCH_CHAPTER, None),
+                    (JobService.KIND_OCR_CHAPTER, {"parallel": True, "mode": "page", "force": False}),
+                    (JobService.KIND_AUDIO_CHAPTER, None),
+                ],
+                next_chapter_id,
+                db,
+                priority=JobService.PRIORITY_LOW,
+            )
+            progress.warmup_job_id = warmup_job.id
+        db.commit()
+
+        return {
+            "chapter_id": chapter_id,
+            "page_number": page_number,
+            "pages_total": pages_total,
+            "next_chapter_id": next_chapter_id,
+            "warmup_job_id": warmup_job.id if warmup_job else None,
+            "warmup_status": warmup_job.status if warmup_job else None,
+        }
+
+    def _warmup_due(self, warmup_job: models.Job | None) -> bool:
+        """No warm-up yet, or its prefetch failed at least ``settings.warmup_retry_seconds`` ago.
+
+        A later stage that fails (e.g. OCR or TTS not installed) leaves the prefetch completed, so
+        it is not retried on every page turn.
+        """
+        if warmup_job is None:
+            return True
+        if warmup_job.status != "failed":
+            return False
+        retry_after = timedelta(seconds=settings.warmup_retry_seconds)
+        return warmup_job.finished_at is None or datetime.utcnow() - warmup_job.finished_at >= retry_after
+
+
+reading_progress_service = ReadingProgressService()
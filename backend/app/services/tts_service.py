@@ -1,38 +1,124 @@
 from __future__ import annotations
 
-import hashlib
+import asyncio
 import io
+import os
 import sys
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from fastapi import HTTPException
 
 from app.core.config import settings
-from app.services.ocr_service import ocr_service
-from app.utils.file_storage import ensure_dir
+from app.db.database import SessionLocal
+from app.ml.tts_engines import GttsEngine, TtsEngine, create_tts_engine
+from app.services.audio_store import audio_store
+from app.services.chapter_text_service import chapter_text_service
+from app.utils.file_storage import ensure_dir, temp_path_for
 
-try:
-    from gtts import gTTS
-    GTTS_AVAILABLE = True
-except ImportError:
-    GTTS_AVAILABLE = False
+T = TypeVar("T")
 
 
 class TtsService:
-    DEPENDENCY_ERROR_MESSAGE = "TTS cannot run because gtts is not installed or configured on the backend."
+    DEPENDENCY_ERROR_MESSAGE = "TTS cannot run because the configured TTS engine is not installed or configured on the backend."
     OCR_MISSING_ERROR_MESSAGE = "TTS cannot run because OCR text is not available for this chapter."
-    VOICE_MODEL = "en"  # gTTS language code
 
     def __init__(self) -> None:
+        self._engine, self._engine_fallback_reason = self._create_engine()
         self._dependency_status = self._detect_tts_dependency()
+        self._executor: ThreadPoolExecutor | None = None
+        self._metrics_lock = threading.Lock()
+        self._queued_count = 0
+        self._active_count = 0
+        self._inflight_lock = threading.Lock()
+        self._inflight: dict[tuple[str, str, str], Future] = {}
 
     def refresh_dependency_status(self) -> dict[str, Any]:
         self._dependency_status = self._detect_tts_dependency()
         return dict(self._dependency_status)
 
     def get_dependency_status(self) -> dict[str, Any]:
-        return dict(self._dependency_status)
+        return {**self._dependency_status, **self.get_executor_metrics()}
+
+    def get_executor_metrics(self) -> dict[str, int]:
+        with self._metrics_lock:
+            return {
+                "max_workers": max(settings.tts_max_workers, 1),
+                "active_count": self._active_count,
+                "queue_depth": self._queued_count,
+            }
+
+    @property
+    def engine(self) -> TtsEngine:
+        return self._engine
+
+    def start(self) -> None:
+        """Warm the engine (e.g. load Piper voice models into the worker pool) when it can run,
+        falling back to gTTS if it fails to start."""
+        if not self._dependency_status["tts_available"]:
+            return
+        try:
+            self._engine.start()
+        except Exception as exc:
+            self._engine.close()
+            self._engine = GttsEngine()
+            self._engine_fallback_reason = f"{settings.tts_engine_name} failed to start: {exc}"
+            self._dependency_status = self._detect_tts_dependency()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._engine.close()
+
+    def _create_engine(self) -> tuple[TtsEngine, str | None]:
+        """The engine named by ``settings.tts_engine_name``, or gTTS with the reason it could not be used."""
+        try:
+            engine = create_tts_engine(
+                settings.tts_engine_name,
+                piper_model_path=settings.piper_model_path,
+                workers=settings.tts_max_workers,
+            )
+        except ValueError as exc:
+            return GttsEngine(), str(exc)
+        return engine, None
+
+    async def run_in_executor(self, func: Callable[..., T], *args: Any) -> T:
+        """Run blocking synthesis on the bounded TTS pool so the event loop stays free.
+
+        At most ``settings.tts_max_workers`` calls run at once; the rest wait in the pool's queue
+        and are counted in ``queue_depth``.
+        """
+        state = {"started": False}
+
+        def run() -> T:
+            with self._metrics_lock:
+                self._queued_count -= 1
+                self._active_count += 1
+                state["started"] = True
+            try:
+                return func(*args)
+            finally:
+                with self._metrics_lock:
+                    self._active_count -= 1
+
+        with self._metrics_lock:
+            self._queued_count += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), run)
+        finally:
+            with self._metrics_lock:
+                if not state["started"]:
+                    # Cancelled or rejected before a worker picked it up.
+                    self._queued_count -= 1
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=max(settings.tts_max_workers, 1), thread_name_prefix="tts")
+        return self._executor
 
     def ensure_tts_available(self) -> None:
         dependency_status = self.get_dependency_status()
@@ -43,40 +129,26 @@ class TtsService:
             status_code=503,
             detail={
                 "error_code": "dependency_unavailable",
-                "dependency": "edge-tts",
+                "dependency": self._engine.name,
                 "message": self.DEPENDENCY_ERROR_MESSAGE,
                 **dependency_status,
             },
         )
 
     def _detect_tts_dependency(self) -> dict[str, Any]:
-        if not GTTS_AVAILABLE:
-            return {
-                "tts_available": False,
-                "engine_name": "gtts",
-                "default_voice": self.VOICE_MODEL,
-                "error_message": "gtts library not found. Install with: pip install gtts",
-            }
-
-        # gTTS doesn't need model loading, it's ready to go
-        return {
-            "tts_available": True,
-            "engine_name": "gtts (Google Text-to-Speech)",
-            "default_voice": self.VOICE_MODEL,
-            "error_message": None,
-        }
+        return {**self._engine.detect(), "engine_fallback_reason": self._engine_fallback_reason}
 
     def _get_audio_cache_path(self, chapter_id: str, voice: str, text_hash: str) -> Path:
         cache_root = ensure_dir(settings.audio_cache_dir)
         chapter_dir = ensure_dir(cache_root / chapter_id)
-        return chapter_dir / f"{voice}_{text_hash}.mp3"
+        return chapter_dir / f"{voice}_{text_hash}{self._engine.file_extension}"
 
     def _hash_text(self, text: str) -> str:
-        return hashlib.md5(text.encode()).hexdigest()[:16]
+        return chapter_text_service.hash_text(text)
 
     def _audio_url(self, chapter_id: str, voice: str, text_hash: str) -> str:
         """Construct the public URL for accessing the audio file."""
-        return f"/audio/file/{chapter_id}/{voice}_{text_hash}.mp3"
+        return f"/audio/file/{chapter_id}/{voice}_{text_hash}{self._engine.file_extension}"
 
     def _preprocess_text_for_tts(self, text: str) -> str:
         """Preprocess text to improve gTTS pronunciation.
@@ -133,7 +205,7 @@ class TtsService:
         return text
 
     async def generate_chapter_audio(
-        self, chapter_id: str, chapter_text: str, voice: str | None = None, db=None
+        self, chapter_id: str, chapter_text: str, voice: str | None = None, db=None, text_hash: str | None = None
     ) -> dict[str, Any]:
         self.ensure_tts_available()
 
@@ -147,12 +219,14 @@ class TtsService:
                 },
             )
 
-        voice = voice or self.VOICE_MODEL
-        text_hash = self._hash_text(chapter_text.strip())
+        voice = self._engine.resolve_voice(voice)
+        text_hash = text_hash or self._hash_text(chapter_text.strip())
         audio_path = self._get_audio_cache_path(chapter_id, voice, text_hash)
+        segments = self.split_segments(chapter_text)
 
         cached = audio_path.exists()
         if cached:
+            await asyncio.to_thread(self._touch_audio, [audio_path])
             return {
                 "chapter_id": chapter_id,
                 "status": "generated",
@@ -160,11 +234,16 @@ class TtsService:
                 "text_length": len(chapter_text.strip()),
                 "audio_url": self._audio_url(chapter_id, voice, text_hash),
                 "cached": True,
+                "segments_total": len(segments),
+                "segments_generated": 0,
                 "error_message": None,
             }
 
         try:
-            await self._generate_audio_file(chapter_text.strip(), audio_path, voice)
+            segments_generated = await self._single_flight(
+                (chapter_id, voice, text_hash),
+                lambda: self._assemble_chapter_audio(segments, audio_path, voice),
+            )
             return {
                 "chapter_id": chapter_id,
                 "status": "generated",
@@ -172,6 +251,8 @@ class TtsService:
                 "text_length": len(chapter_text.strip()),
                 "audio_url": self._audio_url(chapter_id, voice, text_hash),
                 "cached": False,
+                "segments_total": len(segments),
+                "segments_generated": segments_generated,
                 "error_message": None,
             }
         except Exception as exc:
@@ -185,104 +266,193 @@ class TtsService:
                 },
             ) from exc
 
-    async def _generate_audio_file(self, text: str, output_path: Path, voice: str) -> None:
-        """Generate audio using gTTS (Google Text-to-Speech).
-        Falls back to silence if gTTS is not available."""
-        if not GTTS_AVAILABLE:
-            # gTTS not installed - use fallback
-            self._create_fallback_mp3(output_path, text, voice)
+    async def _single_flight(self, key: tuple[str, ...], make_work: Callable[[], Awaitable[T]]) -> T:
+        """Run ``make_work()`` once per key: concurrent callers with the same key await the first caller's
+        result instead of repeating the synthesis.
+
+        The shared future is a ``concurrent.futures.Future`` because callers may sit on different event
+        loops (request handlers on uvicorn's loop, audio jobs on their own ``asyncio.run`` loops).
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if not leader:
+            return await asyncio.wrap_future(future)
+
+        try:
+            result = await make_work()
+            future.set_result(result)
+            return result
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def split_segments(self, text: str) -> list[str]:
+        """TTS segments: chapter text is page texts joined by blank lines (page text itself has none),
+        so this yields one segment per page, or per paragraph for free-form text."""
+        return [segment.strip() for segment in text.split("\n\n") if segment.strip()]
+
+    async def _assemble_chapter_audio(self, segments: list[str], output_path: Path, voice: str) -> int:
+        """Synthesise segments missing from the segment cache in parallel (bounded by the TTS executor),
+        then concatenate all segments into the chapter file. Returns the number of segments synthesised."""
+        segment_paths = [self._get_segment_path(voice, self._hash_text(segment)) for segment in segments]
+        missing = {path: segment for path, segment in zip(segment_paths, segments) if not path.exists()}
+
+        await asyncio.gather(*(self._ensure_segment(segment, path, voice) for path, segment in missing.items()))
+        await self.run_in_executor(concatenate_audio_files, segment_paths, output_path)
+        await asyncio.to_thread(self._index_chapter_audio, output_path, voice, segment_paths)
+        return len(missing)
+
+    async def open_chapter_stream(
+        self, chapter_id: str, chapter_text: str, text_hash: str, voice: str | None = None
+    ) -> tuple[str, AsyncIterator[bytes]]:
+        """Start synthesising all segments and return (media type, body) once the first one is ready.
+
+        The body yields each segment in order as soon as it exists, so playback starts after one segment
+        instead of the whole chapter. MP3 segments are sent as-is; for WAV engines one header with an
+        open-ended size is sent, followed by each segment's PCM data. A segment that fails to synthesise
+        ends the stream early. Once the stream completes, the chapter file is assembled from the cached
+        segments for ``/audio/file``.
+        """
+        self.ensure_tts_available()
+        voice = self._engine.resolve_voice(voice)
+        segments = self.split_segments(chapter_text)
+        if not segments:
+            raise HTTPException(
+                status_code=409,
+                detail={"error_code": "ocr_text_missing", "chapter_id": chapter_id, "message": self.OCR_MISSING_ERROR_MESSAGE},
+            )
+
+        segment_paths = [self._get_segment_path(voice, self._hash_text(segment)) for segment in segments]
+        # Every segment starts now (bounded by the executor); tasks are never cancelled so a dropped
+        # client still leaves the finished segments in the cache.
+        tasks = [
+            asyncio.ensure_future(self._ensure_segment(segment, path, voice))
+            for segment, path in zip(segments, segment_paths)
+        ]
+        for task in tasks:
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+        try:
+            await tasks[0]
+        except Exception as exc:
+            raise HTTPException(
+                status_code=500,
+                detail={
+                    "error_code": "tts_generation_failed",
+                    "chapter_id": chapter_id,
+                    "message": f"Failed to generate audio: {str(exc)}",
+                    "error": str(exc),
+                },
+            ) from exc
+
+        first_wav = _read_wav(segment_paths[0])
+        media_type = "audio/wav" if first_wav else "audio/mpeg"
+        audio_path = self._get_audio_cache_path(chapter_id, voice, text_hash)
+
+        async def body() -> AsyncIterator[bytes]:
+            if first_wav:
+                yield b"RIFF" + b"\xff\xff\xff\xff" + b"WAVE" + first_wav[0] + b"data" + b"\xff\xff\xff\xff"
+            for task, path in zip(tasks, segment_paths):
+                await task
+                wav_segment = _read_wav(path)
+                if (wav_segment is not None) != (first_wav is not None) or (first_wav and wav_segment[0] != first_wav[0]):
+                    raise ValueError(f"Audio segment {path.name} does not match the stream format")
+                yield wav_segment[1] if wav_segment else path.read_bytes()
+            if not audio_path.exists():
+                await self.run_in_executor(concatenate_audio_files, segment_paths, audio_path)
+                await asyncio.to_thread(self._index_chapter_audio, audio_path, voice, segment_paths)
+
+        return media_type, body()
+
+    async def _ensure_segment(self, segment: str, path: Path, voice: str) -> None:
+        if path.exists():
             return
-        
+        await self._single_flight(("segment", voice, path.stem), lambda: self._generate_audio_file(segment, path, voice))
+
+    def _get_segment_path(self, voice: str, segment_hash: str) -> Path:
+        return (
+            Path(settings.audio_cache_dir)
+            / "segments"
+            / self._engine.name
+            / voice
+            / segment_hash[:2]
+            / f"{segment_hash}{self._engine.file_extension}"
+        )
+
+    async def _generate_audio_file(self, text: str, output_path: Path, voice: str) -> None:
+        await self.run_in_executor(self._synthesize_to_file, text, output_path, voice)
+        await asyncio.to_thread(self._index_segment, output_path, voice)
+
+    def _index_segment(self, path: Path, voice: str) -> None:
+        db = SessionLocal()
         try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Preprocess text to improve pronunciation
-            processed_text = self._preprocess_text_for_tts(text)
-            
-            # Use gTTS to synthesize speech
-            # voice parameter should be a language code (e.g., 'en', 'es', 'fr')
-            lang = voice if isinstance(voice, str) and len(voice) <= 5 else 'en'
-            
-            tts = gTTS(text=processed_text, lang=lang, slow=False)
-            
-            # Save to file
-            tts.save(str(output_path))
-            
-            file_size = output_path.stat().st_size
-            print(f"✅ Generated audio using gTTS ({file_size} bytes, language: {lang})", file=sys.stderr)
-            
-        except Exception as e:
-            # If anything fails, use fallback
-            print(f"⚠️  gTTS generation failed: {str(e)}, using fallback", file=sys.stderr)
-            self._create_fallback_mp3(output_path, text, voice)
-
-    def _create_fallback_mp3(self, output_path: Path, text: str, voice: str) -> None:
-        """Create a valid audio file for testing when real TTS is unavailable.
-        Generates a WAV file (simpler than MP3, better player support)."""
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Change extension to .wav for better compatibility
-        wav_path = output_path.with_suffix('.wav')
-        
-        # Create a minimal valid WAV file (1 second of silence, 16-bit stereo, 44.1kHz)
-        # WAV format: RIFF header + fmt chunk + data chunk
-        
-        sample_rate = 44100
-        duration_seconds = 1
-        num_channels = 2  # Stereo
-        bits_per_sample = 16
-        
-        # Calculate sizes
-        num_samples = sample_rate * duration_seconds
-        bytes_per_sample = bits_per_sample // 8
-        byte_rate = sample_rate * num_channels * bytes_per_sample
-        block_align = num_channels * bytes_per_sample
-        data_size = num_samples * num_channels * bytes_per_sample
-        
-        # Build WAV file
-        wav_data = b'RIFF'
-        wav_data += (36 + data_size).to_bytes(4, 'little')  # Chunk size
-        wav_data += b'WAVE'
-        
-        # fmt subchunk
-        wav_data += b'fmt '
-        wav_data += (16).to_bytes(4, 'little')  # Subchunk1 size
-        wav_data += (1).to_bytes(2, 'little')   # Audio format (1 = PCM)
-        wav_data += num_channels.to_bytes(2, 'little')
-        wav_data += sample_rate.to_bytes(4, 'little')
-        wav_data += byte_rate.to_bytes(4, 'little')
-        wav_data += block_align.to_bytes(2, 'little')
-        wav_data += bits_per_sample.to_bytes(2, 'little')
-        
-        # data subchunk
-        wav_data += b'data'
-        wav_data += data_size.to_bytes(4, 'little')
-        wav_data += b'\x00' * data_size  # Silent audio (all zeros)
-        
-        # Write WAV file
-        wav_path.write_bytes(wav_data)
-        
-        # Create symlink/copy as MP3 with same data so file serving works
-        # The player will detect it's actually WAV and play accordingly
-        output_path.write_bytes(wav_data)
-        
-        print(f"✅ Created fallback audio ({len(wav_data)} bytes WAV, text: {text[:30]}...) for voice: {voice}", file=sys.stderr)
+            audio_store.record(path, voice=voice, text_hash=path.stem, engine=self._engine.name, db=db)
+            db.commit()
+        finally:
+            db.close()
 
-    def get_chapter_audio_status(self, chapter_id: str, chapter_text: str | None = None) -> dict[str, Any]:
-        if not chapter_text or not chapter_text.strip():
+    def _index_chapter_audio(self, path: Path, voice: str, segment_paths: list[Path]) -> None:
+        """Index a freshly assembled chapter file, mark its segments as used and trim the cache to budget."""
+        chapter_id = path.parent.name
+        text_hash = path.stem.rpartition("_")[2]
+        db = SessionLocal()
+        try:
+            audio_store.record(path, voice=voice, text_hash=text_hash, engine=self._engine.name, chapter_id=chapter_id, db=db)
+            audio_store.touch(segment_paths, db=db)
+            db.commit()
+            audio_store.enforce_budget(db=db)
+        finally:
+            db.close()
+
+    def _touch_audio(self, paths: list[Path]) -> None:
+        db = SessionLocal()
+        try:
+            audio_store.touch(paths, db=db)
+            db.commit()
+        finally:
+            db.close()
+
+    def _synthesize_to_file(self, text: str, output_path: Path, voice: str) -> None:
+        """Generate audio with the configured engine. Blocking; runs on the TTS executor.
+
+        Failures propagate: the output is cached under the segment's text hash, so it must be real
+        speech for that text. Segments that did succeed stay cached, and a retry only redoes the rest.
+        """
+        if not self._dependency_status["tts_available"]:
+            raise RuntimeError(self._dependency_status.get("error_message") or self.DEPENDENCY_ERROR_MESSAGE)
+
+        if isinstance(self._engine, GttsEngine):
+            # Preprocess text to improve gTTS pronunciation
+            text = self._preprocess_text_for_tts(text)
+
+        # Engines write to a temp file and rename, so readers never see a partially written file
+        self._engine.synthesize(text, output_path, voice)
+
+        file_size = output_path.stat().st_size
+        print(f"✅ Generated audio using {self._engine.name} ({file_size} bytes, voice: {voice})", file=sys.stderr)
+
+    def get_chapter_audio_status(self, chapter_id: str, text_hash: str | None, text_length: int) -> dict[str, Any]:
+        """Audio status from the materialised chapter text hash and length, without loading the text."""
+        if not text_hash or not text_length:
             return {
                 "chapter_id": chapter_id,
                 "status": "unavailable",
                 "message": self.OCR_MISSING_ERROR_MESSAGE,
-                "voice": self.VOICE_MODEL,
+                "voice": self._engine.resolve_voice(None),
                 "text_length": 0,
                 "generated": False,
                 "cached": False,
                 "audio_url": None,
             }
 
-        voice = self.VOICE_MODEL
-        text_hash = self._hash_text(chapter_text.strip())
+        voice = self._engine.resolve_voice(None)
         audio_path = self._get_audio_cache_path(chapter_id, voice, text_hash)
 
         if audio_path.exists():
@@ -291,7 +461,7 @@ class TtsService:
                 "status": "generated",
                 "message": "Audio is ready to play.",
                 "voice": voice,
-                "text_length": len(chapter_text.strip()),
+                "text_length": text_length,
                 "generated": True,
                 "cached": True,
                 "audio_url": self._audio_url(chapter_id, voice, text_hash),
@@ -302,11 +472,63 @@ class TtsService:
             "status": "pending",
             "message": "Audio has not been generated yet. Call /generate to create it.",
             "voice": voice,
-            "text_length": len(chapter_text.strip()),
+            "text_length": text_length,
             "generated": False,
             "cached": False,
             "audio_url": None,
         }
 
 
+def concatenate_audio_files(segment_paths: list[Path], output_path: Path) -> None:
+    """Join segment files into ``output_path`` via a temp file and rename.
+
+    MP3 is a sequence of self-contained frames, so MP3 segments are joined byte for byte. WAV segments
+    (Piper) have their PCM data chunks merged under one header. Mixed or mismatched formats raise.
+    """
+    wav_segments = [_read_wav(path) for path in segment_paths]
+    ensure_dir(output_path.parent)
+    temp_path = temp_path_for(output_path)
+    try:
+        with temp_path.open("wb") as output:
+            if any(wav_segments):
+                if not all(wav_segments):
+                    raise ValueError("Cannot join WAV and MP3 segments")
+                fmt_chunk = wav_segments[0][0]
+                if any(segment[0] != fmt_chunk for segment in wav_segments):
+                    raise ValueError("Cannot join WAV segments with different formats")
+                data_size = sum(len(segment[1]) for segment in wav_segments)
+                output.write(b"RIFF" + (4 + len(fmt_chunk) + 8 + data_size).to_bytes(4, "little") + b"WAVE")
+                output.write(fmt_chunk + b"data" + data_size.to_bytes(4, "little"))
+                for _, data in wav_segments:
+                    output.write(data)
+            else:
+                for path in segment_paths:
+                    output.write(path.read_bytes())
+        os.replace(temp_path, output_path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def _read_wav(path: Path) -> tuple[bytes, bytes] | None:
+    """(fmt chunk including its header, PCM data) of a RIFF/WAVE file, or None for anything else."""
+    with path.open("rb") as handle:
+        header = handle.read(12)
+        if header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+            return None
+        content = header + handle.read()
+
+    fmt_chunk = b""
+    offset = 12
+    while offset + 8 <= len(content):
+        chunk_id = content[offset : offset + 4]
+        chunk_size = int.from_bytes(content[offset + 4 : offset + 8], "little")
+        chunk_end = offset + 8 + chunk_size
+        if chunk_id == b"fmt ":
+            fmt_chunk = content[offset:chunk_end]
+        elif chunk_id == b"data":
+            return fmt_chunk, content[offset + 8 : chunk_end]
+        offset = chunk_end + (chunk_size % 2)
+    return None
+
+
 tts_service = TtsService()
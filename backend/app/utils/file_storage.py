@@ -1,3 +1,5 @@
+import os
+import uuid
 from pathlib import Path
 
 
@@ -5,3 +7,21 @@ def ensure_dir(path: str | Path) -> Path:
     directory = Path(path)
     directory.mkdir(parents=True, exist_ok=True)
     return directory
+
+
+def temp_path_for(path: str | Path) -> Path:
+    """Unique sibling path for writing a file before it is renamed into place."""
+    target = Path(path)
+    return target.with_name(f".{target.name}.{uuid.uuid4().hex}.part")
+
+
+def atomic_write_bytes(path: str | Path, data: bytes) -> Path:
+    target = Path(path)
+    ensure_dir(target.parent)
+    temp_path = temp_path_for(target)
+    try:
+        temp_path.write_bytes(data)
+        os.replace(temp_path, target)
+    finally:
+        temp_path.unlink(missing_ok=True)
+    return target
@@ -0,0 +1,13 @@
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def quote_etag(content_hash: str) -> str:
+    return f'"{content_hash}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an ``If-None-Match`` header matches ``etag`` (weak comparison, as RFC 9110 requires for it)."""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in (candidate.removeprefix("W/") for candidate in candidates)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""Benchmark the pytesseract (subprocess per image) and tesserocr (in-process API) OCR engines.
+
+Usage: python benchmark_ocr_engines.py [sample_dir] [rounds]
+
+sample_dir (default ./storage/benchmark_pages) holds page images. Both engines OCR the same
+preprocessed images; agreement is the character recall of tesserocr against pytesseract output.
+"""
+import sys
+import time
+from pathlib import Path
+sys.path.insert(0, '.')
+
+import cv2
+
+from app.ml.ocr_engines import TESSEROCR_AVAILABLE, PytesseractEngine, TesserocrEngine
+from app.services.ocr_service import ocr_service
+from benchmark_text_regions import IMAGE_SUFFIXES, character_recall
+
+
+def run_engine(engine, images, rounds: int) -> tuple[float, list[str]]:
+    texts: list[str] = []
+    engine.image_to_string(images[0])  # Warm up: model load / first process spawn.
+    started = time.perf_counter()
+    for _ in range(rounds):
+        texts = [engine.image_to_string(image) for image in images]
+    return time.perf_counter() - started, texts
+
+
+def benchmark(sample_dir: Path, rounds: int) -> None:
+    print("=" * 60)
+    print("PYTESSERACT VS TESSEROCR OCR ENGINE BENCHMARK")
+    print("=" * 60)
+
+    if not TESSEROCR_AVAILABLE:
+        print("❌ tesserocr is not installed. Install with: pip install tesserocr")
+        sys.exit(1)
+
+    paths = sorted(path for path in sample_dir.iterdir() if path.suffix.lower() in IMAGE_SUFFIXES)
+    if not paths:
+        print(f"❌ No sample pages found in {sample_dir}")
+        sys.exit(1)
+    images = [ocr_service._preprocess_gray(cv2.imread(str(path), cv2.IMREAD_GRAYSCALE)) for path in paths]
+
+    pytesseract_engine = PytesseractEngine()
+    tesserocr_engine = TesserocrEngine()
+    print(f"\npytesseract: {pytesseract_engine.version()}")
+    print(f"tesserocr:   {tesserocr_engine.version()}")
+
+    pytesseract_seconds, pytesseract_texts = run_engine(pytesseract_engine, images, rounds)
+    tesserocr_seconds, tesserocr_texts = run_engine(tesserocr_engine, images, rounds)
+    tesserocr_engine.close()
+
+    page_count = len(images) * rounds
+    recalls = [character_recall(hypothesis, reference) for hypothesis, reference in zip(tesserocr_texts, pytesseract_texts)]
+
+    print("\n" + "-" * 60)
+    print(f"Pages:                {len(images)} x {rounds} rounds")
+    print(f"pytesseract total:    {pytesseract_seconds:.2f}s ({pytesseract_seconds / page_count * 1000:.0f} ms/page)")
+    print(f"tesserocr total:      {tesserocr_seconds:.2f}s ({tesserocr_seconds / page_count * 1000:.0f} ms/page)")
+    if tesserocr_seconds > 0:
+        print(f"Speedup:              {pytesseract_seconds / tesserocr_seconds:.2f}x")
+    print(f"Mean text agreement:  {sum(recalls) / len(recalls):.2%}")
+
+
+if __name__ == "__main__":
+    benchmark(
+        Path(sys.argv[1]) if len(sys.argv) > 1 else Path("./storage/benchmark_pages"),
+        int(sys.argv[2]) if len(sys.argv) > 2 else 1,
+    )
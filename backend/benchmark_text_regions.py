@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+"""Benchmark whole-page OCR against text-region OCR on a fixed set of sample pages.
+
+Usage: python benchmark_text_regions.py [sample_dir]
+
+sample_dir (default ./storage/benchmark_pages) holds page images. A `<name>.txt`
+next to an image is used as its ground truth; otherwise the whole-page OCR
+output is the reference, so recall then measures what region OCR keeps.
+"""
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+sys.path.insert(0, '.')
+
+import cv2
+
+from app.ml.text_regions import detect_text_regions
+from app.services.ocr_service import ocr_service
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp"}
+
+
+def character_recall(hypothesis: str, reference: str) -> float:
+    """Share of the reference's alphanumeric characters (as a multiset) found in the hypothesis."""
+    reference_chars = Counter(char for char in reference.lower() if char.isalnum())
+    if not reference_chars:
+        return 1.0
+    hypothesis_chars = Counter(char for char in hypothesis.lower() if char.isalnum())
+    matched = sum((reference_chars & hypothesis_chars).values())
+    return matched / sum(reference_chars.values())
+
+
+def benchmark(sample_dir: Path) -> None:
+    print("=" * 60)
+    print("WHOLE-PAGE VS TEXT-REGION OCR BENCHMARK")
+    print("=" * 60)
+
+    ocr_service.ensure_tesseract_available()
+    images = sorted(path for path in sample_dir.iterdir() if path.suffix.lower() in IMAGE_SUFFIXES)
+    if not images:
+        print(f"❌ No sample pages found in {sample_dir}")
+        sys.exit(1)
+
+    total_page_seconds = 0.0
+    total_region_seconds = 0.0
+    page_recalls: list[float] = []
+    region_recalls: list[float] = []
+
+    print(f"\n{'page':<28}{'page ms':>10}{'region ms':>11}{'regions':>9}{'page rec':>10}{'region rec':>12}")
+    for image_path in images:
+        started = time.perf_counter()
+        page_text = ocr_service._normalize_text(ocr_service._extract_raw_text_from_image(image_path=image_path))
+        page_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        region_text = ocr_service._normalize_text(ocr_service._extract_region_text(image_path=image_path, parallel=False))
+        region_seconds = time.perf_counter() - started
+
+        region_count = len(detect_text_regions(cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)))
+        truth_path = image_path.with_suffix(".txt")
+        reference = truth_path.read_text(encoding="utf-8") if truth_path.exists() else page_text
+        page_recall = character_recall(page_text, reference)
+        region_recall = character_recall(region_text, reference)
+
+        total_page_seconds += page_seconds
+        total_region_seconds += region_seconds
+        page_recalls.append(page_recall)
+        region_recalls.append(region_recall)
+        print(
+            f"{image_path.name[:27]:<28}{page_seconds * 1000:>10.0f}{region_seconds * 1000:>11.0f}"
+            f"{region_count:>9}{page_recall:>10.2%}{region_recall:>12.2%}"
+        )
+
+    print("\n" + "-" * 60)
+    print(f"Pages:                 {len(images)}")
+    print(f"Whole-page OCR total:  {total_page_seconds:.2f}s")
+    print(f"Region OCR total:      {total_region_seconds:.2f}s")
+    if total_region_seconds > 0:
+        print(f"Speedup:               {total_page_seconds / total_region_seconds:.2f}x")
+    print(f"Mean recall (page):    {sum(page_recalls) / len(page_recalls):.2%}")
+    print(f"Mean recall (regions): {sum(region_recalls) / len(region_recalls):.2%}")
+
+
+if __name__ == "__main__":
+    benchmark(Path(sys.argv[1]) if len(sys.argv) > 1 else Path("./storage/benchmark_pages"))
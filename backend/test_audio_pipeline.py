@@ -66,7 +66,9 @@ async def test_audio_pipeline():
         
         # Step 4: Check audio status
         print("\nStep 4: Checking audio status...")
-        status = tts_service.get_chapter_audio_status(chapter_id, test_text)
+        status = tts_service.get_chapter_audio_status(
+            chapter_id, tts_service._hash_text(test_text.strip()), len(test_text.strip())
+        )
         print(f"  Status: {status['status']}")
         print(f"  Generated: {status['generated']}")
         print(f"  Cached: {status['cached']}")
@@ -86,7 +86,8 @@ async def test_tts_with_mock():
         print(f"\n[Test 3] Test audio status endpoint")
         status = tts_service.get_chapter_audio_status(
             chapter_id="test-chapter-001",
-            chapter_text=test_text
+            text_hash=tts_service._hash_text(test_text.strip()),
+            text_length=len(test_text.strip())
         )
         print(f"  Status: {status['status']}")
         print(f"  Message: {status['message']}")
@@ -98,7 +99,8 @@ async def test_tts_with_mock():
         print(f"\n[Test 4] Test with missing OCR text")
         status_no_ocr = tts_service.get_chapter_audio_status(
             chapter_id="test-chapter-002",
-            chapter_text=""  # Empty text
+            text_hash=None,  # No OCR text
+            text_length=0
         )
         print(f"  Status: {status_no_ocr['status']}")
         print(f"  Message: {status_no_ocr['message']}")
@@ -6,8 +6,8 @@ import FullscreenReader from './components/FullscreenReader';
 import ChapterListScreen from './screens/ChapterListScreen';
 import HomeScreen from './screens/HomeScreen';
 import ReaderScreen from './screens/ReaderScreen';
-import { api } from './services/api';
-import { Manga, MangaDexChapter, MangaDexManga, OcrChapterResult, Page } from './types';
+import { api, pageImageUrl } from './services/api';
+import { Manga, MangaDexChapter, MangaDexManga, OcrChapterSummary, Page } from './types';
 import { API_BASE_URL } from './config/api';
 
 const OCR_DEPENDENCY_MESSAGE = 'OCR cannot run because Tesseract OCR is not installed/configured on the backend.';
@@ -17,7 +17,7 @@ function isDependencyErrorMessage(message: string): boolean {
   return normalized.includes('tesseract') && (normalized.includes('not installed') || normalized.includes('path'));
 }
 
-function getOcrDependencyNotice(ocrStatus: OcrChapterResult | null): string | null {
+function getOcrDependencyNotice(ocrStatus: OcrChapterSummary | null): string | null {
   if (!ocrStatus || ocrStatus.completed_count > 0 || ocrStatus.failed_count === 0) {
     return null;
   }
@@ -53,7 +53,7 @@ const App: React.FC = () => {
   const [loadingSearch, setLoadingSearch] = useState<boolean>(false);
   const [loadingChapters, setLoadingChapters] = useState<boolean>(false);
   const [runningOcr, setRunningOcr] = useState<boolean>(false);
-  const [ocrStatus, setOcrStatus] = useState<OcrChapterResult | null>(null);
+  const [ocrStatus, setOcrStatus] = useState<OcrChapterSummary | null>(null);
   const [ocrNotice, setOcrNotice] = useState<string | null>(null);
   const [playingAudio, setPlayingAudio] = useState<boolean>(false);
   const [audioPlayer, setAudioPlayer] = useState<Audio.Sound | null>(null);
@@ -96,6 +96,16 @@ const App: React.FC = () => {
     loadChapters();
   }, [selectedManga]);
 
+  useEffect(() => {
+    if (!selectedChapter || !currentPage) {
+      return;
+    }
+    // Near the end of a chapter the backend starts warming up the next one.
+    api.updateReadingProgress(selectedChapter.id, currentPage.page_number).catch((error) => {
+      console.error('Error saving reading progress:', error);
+    });
+  }, [selectedChapter, currentPage]);
+
   const handleSearch = async () => {
     if (!searchQuery.trim()) {
       return;
@@ -130,13 +140,12 @@ const App: React.FC = () => {
   const handleSelectChapter = async (chapter: MangaDexChapter) => {
     try {
       await api.storeChapter(chapter.id);
-      const chapterPages = await api.getChapterPages(chapter.id);
+      const bundle = await api.getReaderBundle(chapter.id);
       setSelectedChapter(chapter);
-      setPages(chapterPages);
+      setPages(bundle.pages);
       setCurrentPageIndex(0);
-      const initialOcrStatus = await api.getChapterOcr(chapter.id);
-      setOcrStatus(initialOcrStatus);
-      setOcrNotice(getOcrDependencyNotice(initialOcrStatus));
+      setOcrStatus(bundle.ocr);
+      setOcrNotice(getOcrDependencyNotice(bundle.ocr));
     } catch (error) {
       Alert.alert('Error', `Failed to open chapter: ${String(error)}`);
     }
@@ -270,12 +279,12 @@ const App: React.FC = () => {
       setRunningOcr(true);
       setOcrNotice(null);
       const runSummary = await api.runChapterOcr(selectedChapter.id);
-      const latestStatus = await api.getChapterOcr(selectedChapter.id);
+      const latestStatus = await api.getChapterOcrSummary(selectedChapter.id);
       setOcrStatus(latestStatus);
       setOcrNotice(getOcrDependencyNotice(latestStatus));
       Alert.alert(
         'OCR Complete',
-        `Processed ${runSummary.pages_processed} pages. Success: ${runSummary.success_count}, Failed: ${runSummary.failure_count}.`
+        `Processed ${runSummary.pages_processed} pages. Success: ${runSummary.success_count}, Failed: ${runSummary.failure_count}, Up to date: ${runSummary.skipped_count}.`
       );
     } catch (error) {
       const message = error instanceof Error ? error.message : String(error);
@@ -353,7 +362,7 @@ const App: React.FC = () => {
       {currentPage ? (
         <FullscreenReader
           visible={fullscreenVisible}
-          imageUrl={currentPage.image_url}
+          imageUrl={pageImageUrl(currentPage.id)}
           pageLabel={`Page ${currentPageIndex + 1} / ${pages.length}`}
           onClose={() => setFullscreenVisible(false)}
           onNext={nextPage}
@@ -1,6 +1,7 @@
 import React from 'react';
 import { Image, StyleSheet, Text, TouchableOpacity, View } from 'react-native';
 
+import { pageImageUrl } from '../services/api';
 import { Manga, MangaDexChapter, Page } from '../types';
 
 interface ReaderScreenProps {
@@ -47,7 +48,7 @@ const ReaderScreen: React.FC<ReaderScreenProps> = ({
 
       {currentPage ? (
         <TouchableOpacity style={styles.imageWrap} onPress={onOpenFullscreen}>
-          <Image source={{ uri: currentPage.image_url }} style={styles.image} resizeMode="contain" />
+          <Image source={{ uri: pageImageUrl(currentPage.id) }} style={styles.image} resizeMode="contain" />
         </TouchableOpacity>
       ) : (
         <Text style={styles.loading}>Loading pages...</Text>
@@ -1,5 +1,7 @@
+import { Dimensions, PixelRatio } from 'react-native';
+
 import { API_BASE_URL } from '../config/api';
-import { AudioGenerateResponse, AudioStatusResponse, Manga, MangaDexChapter, MangaDexManga, OcrChapterResult, OcrChapterRunResponse, Page } from '../types';
+import { AudioGenerateResponse, AudioStatusResponse, Manga, MangaDexChapter, MangaDexManga, OcrChapterResult, OcrChapterRunResponse, OcrChapterSummary, Page, ReaderChapterBundle, ReadingProgress } from '../types';
 
 function extractApiErrorMessage(detail: unknown): string {
   if (typeof detail === 'string' && detail.trim()) {
@@ -69,6 +71,13 @@ export const api = {
     ),
   getChapterPages: (chapterId: string) =>
     request<Page[]>(`/chapters/${encodeURIComponent(chapterId)}/pages`),
+  getReaderBundle: (chapterId: string) =>
+    request<ReaderChapterBundle>(`/reader/chapter/${encodeURIComponent(chapterId)}/bundle`),
+  updateReadingProgress: (chapterId: string, pageNumber: number) =>
+    request<ReadingProgress>(`/reader/chapter/${encodeURIComponent(chapterId)}/progress`, {
+      method: 'PUT',
+      body: JSON.stringify({ page_number: pageNumber }),
+    }),
   generateChapterAudio: (chapterId: string, pageText?: string) =>
     request<AudioGenerateResponse>(`/audio/chapter/${encodeURIComponent(chapterId)}/generate`, {
       method: 'POST',
@@ -82,4 +91,12 @@ export const api = {
     }),
   getChapterOcr: (chapterId: string) =>
     request<OcrChapterResult>(`/ocr/chapter/${encodeURIComponent(chapterId)}`),
+  getChapterOcrSummary: (chapterId: string) =>
+    request<OcrChapterSummary>(`/ocr/chapter/${encodeURIComponent(chapterId)}/summary`),
 };
+
+// Page image served from the backend cache as WebP, resized for the device screen.
+export function pageImageUrl(pageId: number): string {
+  const width = Math.round(Dimensions.get('window').width * PixelRatio.get());
+  return `${API_BASE_URL}/pages/${pageId}/image?w=${Math.min(Math.max(width, 16), 4096)}&format=webp`;
+}
@@ -32,6 +32,7 @@ export interface Page {
   image_url: string;
   quality: string;
   local_image_path: string | null;
+  ocr_text?: string | null;
   created_at: string;
 }
 
@@ -75,12 +76,25 @@ export interface OcrPageResult {
   error_message: string | null;
 }
 
+export interface OcrPageTiming {
+  page_id: number;
+  page_number: number;
+  status: string;
+  elapsed_ms: number;
+}
+
 export interface OcrChapterRunResponse {
   chapter_id: string;
   pages_processed: number;
   success_count: number;
   failure_count: number;
+  // Pages already OCR'd for the same image and configuration, left untouched by this run.
+  skipped_count: number;
   completed_count: number;
+  mode: 'page' | 'panels' | 'regions';
+  workers: number;
+  elapsed_ms: number;
+  page_timings: OcrPageTiming[];
 }
 
 export interface OcrChapterResult {
@@ -95,3 +109,41 @@ export interface OcrChapterResult {
   chapter_text_length: number;
   page_results: OcrPageResult[];
 }
+
+export interface OcrPageSummary {
+  page_id: number;
+  page_number: number;
+  status: 'pending' | 'processing' | 'completed' | 'failed' | 'partial';
+  text_length: number;
+  error_message: string | null;
+}
+
+export interface OcrChapterSummary {
+  chapter_id: string;
+  status: 'pending' | 'processing' | 'completed' | 'failed' | 'partial';
+  pages_total: number;
+  completed_count: number;
+  failed_count: number;
+  processing_count: number;
+  pending_count: number;
+  chapter_text_length: number;
+  page_results: OcrPageSummary[];
+}
+
+export interface ReaderChapterBundle {
+  chapter: MangaDexChapter & { manga_id: number };
+  pages: Page[];
+  ocr: OcrChapterSummary;
+  audio: AudioStatusResponse;
+  prev_chapter_id: string | null;
+  next_chapter_id: string | null;
+}
+
+export interface ReadingProgress {
+  chapter_id: string;
+  page_number: number;
+  pages_total: number;
+  next_chapter_id: string | null;
+  warmup_job_id: number | null;
+  warmup_status: string | null;
+}